@@ -1,3 +1,5 @@
+import functools
+
 # import boto3
 from strands import Agent, tool
 from strands.models import BedrockModel
@@ -20,31 +22,37 @@ def market_data(ticker: str) -> dict:
 #     profile_name="your-profile",  # Optional: Use a specific profile
 # )
 
-# Create a Bedrock model with the custom session
-bedrock_model = BedrockModel(
-    model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-    region_name="us-west-2",
-    temperature=0.1,
-    top_p=0.5,
-    max_tokens=2048,
-    # boto_session=session  # Optional: Use a custom boto3 session
-)
-
-agent = Agent(
-    system_prompt="You are a financial analyst assistant specialized in market data analysis.",
-    tools=[market_data],
-    model=bedrock_model,
-)
+@functools.lru_cache(maxsize=1)
+def get_agent() -> Agent:
+    """Create the agent on first use so importing this module stays cheap."""
+    # Create a Bedrock model with the custom session
+    bedrock_model = BedrockModel(
+        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+        temperature=0.1,
+        top_p=0.5,
+        max_tokens=2048,
+        # boto_session=session  # Optional: Use a custom boto3 session
+    )
+
+    return Agent(
+        system_prompt="You are a financial analyst assistant specialized in market data analysis.",
+        tools=[market_data],
+        model=bedrock_model,
+    )
 
 
 def main():
-    result = agent("What's the current trading volume for AAPL?")
-    print("\n" + "=" * 50 + "\n")
-    print(f"Analysis for AAPL:\n {result.message["content"][0]["text"]}")
-    print(f"Total tokens: {result.metrics.accumulated_usage["totalTokens"]}")
-    print(f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds")
-    print(f"Tools used: {list(result.metrics.tool_metrics.keys())}")
-    print("\n" + "=" * 50 + "\n")
+    result = get_agent()("What's the current trading volume for AAPL?")
+    lines = [
+        "\n" + "=" * 50 + "\n",
+        f"Analysis for AAPL:\n {result.message["content"][0]["text"]}",
+        f"Total tokens: {result.metrics.accumulated_usage["totalTokens"]}",
+        f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds",
+        f"Tools used: {list(result.metrics.tool_metrics.keys())}",
+        "\n" + "=" * 50 + "\n",
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -1,38 +1,86 @@
 import argparse
 import asyncio
+import functools
+import importlib.util
 
 import httpx
+from botocore.config import Config as BotocoreConfig
 from loguru import logger
-from rich import print as rprint
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 from strands import Agent, tool
+from strands.agent import AgentResult
 from strands.models import BedrockModel
 
+from cache import FileCache
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; the stdlib parser accepts the same bytes
+    from json import loads as json_loads
 
 API_BASE_URL = "https://api.financialdatasets.ai/prices/snapshot"
 USER_AGENT = "Mozilla/0.1"
+REQUEST_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+
+# Keep-alive and adaptive retries for the Bedrock runtime client
+BEDROCK_CLIENT_CONFIG = BotocoreConfig(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# Shared console; highlighting is off to skip the regex pass over every printed line
+console = Console(highlight=False)
+
+# Snapshot responses keyed by ticker; fresh for 60 seconds by default
+snapshot_cache = FileCache()
+
+# Shared client so successive requests reuse pooled connections instead of
+# paying for DNS + TCP + TLS on every call. HTTP/2 is used when `h2` is installed.
+http_client = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=10,
+    headers=REQUEST_HEADERS,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+# Bounds the number of in-flight snapshot requests when fetching tickers in batch
+MAX_CONCURRENT_REQUESTS = 10
+request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
 
 async def make_fd_api_request(ticker: str) -> dict:
+    cached = snapshot_cache.get(ticker)
+    if cached is not None:
+        return cached
+
+    # An expired entry can still be revalidated with a conditional GET
+    stale = snapshot_cache.get_entry(ticker)
+    etag = stale.get("etag") if stale else None
+    headers = {"If-None-Match": etag} if etag else None
+
     url = f"{API_BASE_URL}/?ticker={ticker}"
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except httpx.RequestError as e:
-            logger.error(f"Error making API request: {e}")
-            return {}
+    try:
+        async with request_semaphore:
+            response = await http_client.get(url, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            snapshot_cache.set(ticker, stale["data"], etag=etag)
+            return stale["data"]
+        response.raise_for_status()
+        data = json_loads(response.content)
+        snapshot_cache.set(ticker, data, etag=response.headers.get("ETag"))
+        return data
+    except httpx.RequestError as e:
+        logger.error(f"Error making API request: {e}")
+        return {}
 
 
-# Define a market data retrieval tool
-@tool
-async def market_data(ticker: str) -> dict:
-    """Retrieve current market data for a given ticker symbol from an API."""
-    # Implementation to fetch real-time market data
+async def fetch_market_data(ticker: str) -> dict:
+    """Fetch a snapshot for ``ticker`` and reduce it to the fields the agent needs."""
     data = await make_fd_api_request(ticker)
     # logger.info(data)
     if not data:
@@ -48,7 +96,7 @@ async def market_data(ticker: str) -> dict:
     day_change_percent = data["snapshot"]["day_change_percent"]
 
     # Create a formatted string for display in the console
-    rprint(f"\n[bold green]Fetched market data for {ticker}[/bold green] ✅")
+    console.print(f"\n[bold green]Fetched market data for {ticker}[/bold green] ✅")
 
     return {
         "ticker": ticker,
@@ -59,67 +107,133 @@ async def market_data(ticker: str) -> dict:
     }
 
 
-# Create a Bedrock model with the custom session
-bedrock_model = BedrockModel(
-    model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-    region_name="us-west-2",
-    temperature=0.1,
-    top_p=0.5,
-    max_tokens=1024,
-)
-
-agent = Agent(
-    system_prompt="You are a financial analyst assistant specialized in market data analysis.",
-    tools=[market_data],
-    model=bedrock_model,
-    callback_handler=None,  # This supresses the agent's thinking trace
-)
+# Define a market data retrieval tool
+@tool
+async def market_data(ticker: str) -> dict:
+    """Retrieve current market data for a given ticker symbol from an API."""
+    # Implementation to fetch real-time market data
+    return await fetch_market_data(ticker)
 
 
-async def main():
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="Financial market data analyzer")
-    parser.add_argument(
-        "ticker",
-        nargs="?",
-        default="GOOGL",
-        help="Ticker symbol to analyze (default: GOOGL)",
+@tool
+async def market_data_batch(tickers: list[str]) -> dict:
+    """Retrieve current market data for several ticker symbols at once from an API."""
+    # Issue all snapshot requests concurrently; total latency is ~one round-trip.
+    # Repeated tickers are fetched once.
+    unique_tickers = list(dict.fromkeys(tickers))
+    results = await asyncio.gather(
+        *(fetch_market_data(ticker) for ticker in unique_tickers), return_exceptions=True,
+    )
+    batch = {}
+    for ticker, result in zip(unique_tickers, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(f"Unable to fetch market data for ticker: {ticker}: {result}")
+        batch[ticker] = {} if isinstance(result, Exception) else result
+    return batch
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent() -> Agent:
+    """Create the agent on first use, after argument parsing has succeeded."""
+    # Create a Bedrock model with the custom session
+    bedrock_model = BedrockModel(
+        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+        temperature=0.1,
+        top_p=0.5,
+        max_tokens=1024,
+        boto_client_config=BEDROCK_CLIENT_CONFIG,
     )
-    args = parser.parse_args()
 
-    ticker = args.ticker.upper()
-    result = agent(f"What's the current market data for {ticker}?")
+    return Agent(
+        system_prompt="You are a financial analyst assistant specialized in market data analysis.",
+        tools=[market_data, market_data_batch],
+        model=bedrock_model,
+        callback_handler=None,  # This supresses the agent's thinking trace
+    )
 
-    console = Console()
 
-    # Create a panel for the analysis
-    analysis_panel = Panel(
-        result.message["content"][0]["text"],
+def analysis_panel(ticker: str, text: str) -> Panel:
+    """Create a panel for the analysis."""
+    # Wrap model output in Text so rich does not parse it for markup
+    return Panel(
+        Text(text),
         title=f"[bold cyan]Analysis for {ticker}[/bold cyan]",
         border_style="cyan",
         expand=False,
     )
 
+
+async def stream_analysis(ticker: str, prompt: str) -> AgentResult | None:
+    """Run the agent and render its answer into a live panel as tokens arrive."""
+    text = ""
+    result = None
+    console.print("\n")
+    with Live(analysis_panel(ticker, text), console=console, refresh_per_second=8) as live:
+        # Run the agent on this event loop so the async tools share `http_client`
+        async for event in get_agent().stream_async(prompt):
+            if "data" in event:
+                text += event["data"]
+                live.update(analysis_panel(ticker, text))
+            elif "result" in event:
+                result = event["result"]
+        if result is None:
+            # Leave the streamed text in place; there is no final message to settle on
+            logger.error(f"Agent stream ended without a result for ticker: {ticker}")
+            return None
+        # Settle on the final message, without any text streamed before tool calls
+        final_text = "".join(block["text"] for block in result.message["content"] if "text" in block)
+        live.update(analysis_panel(ticker, final_text))
+    return result
+
+
+def render_metrics(result: AgentResult) -> None:
+    """Print a table of agent metrics."""
     # Create a table for metrics
     metrics_table = Table(show_header=True, header_style="bold magenta")
     metrics_table.add_column("Agent Metrics", style="dim")
     metrics_table.add_column("Value")
 
-    metrics_table.add_row(
-        "Total tokens", str(result.metrics.accumulated_usage["totalTokens"]),
-    )
-    metrics_table.add_row(
-        "Execution time", f"{sum(result.metrics.cycle_durations):.2f} seconds",
-    )
-    metrics_table.add_row("Tools used", ", ".join(result.metrics.tool_metrics.keys()))
+    rows = [
+        ("Total tokens", str(result.metrics.accumulated_usage["totalTokens"])),
+        ("Execution time", f"{sum(result.metrics.cycle_durations):.2f} seconds"),
+        ("Tools used", ", ".join(result.metrics.tool_metrics.keys())),
+    ]
+    for row in rows:
+        metrics_table.add_row(*row)
 
     # Print the results
-    console.print("\n")
-    console.print(analysis_panel)
-    console.print("\n")
-    console.print(metrics_table)
-    console.print("\n")
+    console.print("\n", metrics_table, "\n", sep="\n")
+
+
+async def main():
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Financial market data analyzer")
+    parser.add_argument(
+        "ticker",
+        nargs="*",
+        default=["GOOGL"],
+        help="Ticker symbol(s) to analyze (default: GOOGL)",
+    )
+    args = parser.parse_args()
+
+    tickers = ", ".join(t.upper() for t in args.ticker)
+    try:
+        result = await stream_analysis(tickers, f"What's the current market data for {tickers}?")
+    finally:
+        await http_client.aclose()
+
+    if result is not None:
+        render_metrics(result)
 
 
 if __name__ == "__main__":
+    # uvloop has lower per-callback overhead than the default loop; it is optional and
+    # unavailable on Windows, so fall back to the standard event loop without it
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main())
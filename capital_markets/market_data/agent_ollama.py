@@ -1,10 +1,23 @@
+import contextlib
+import os
 import sys
+import threading
+from typing import Any
 
 import requests
-from rich import print as rprint
+from rich.console import Console
 from strands import Agent, tool
 from strands.models.ollama import OllamaModel
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; the stdlib parser accepts the same bytes
+    from json import loads as json_loads
+
+
+# Shared console; highlighting is off to skip the regex pass over every printed line
+console = Console(highlight=False)
+
 
 @tool
 def market_data(ticker: str) -> dict:
@@ -13,53 +26,66 @@ def market_data(ticker: str) -> dict:
     return {"ticker": ticker, "price": 123.45, "volume": 1000000}
 
 
-def check_ollama_availability(host: str = "http://localhost:11434") -> tuple[bool, str]:
+def stream_text(**kwargs: Any) -> None:
+    """Callback handler that prints response text as it streams, without the reasoning trace."""
+    if data := kwargs.get("data"):
+        console.out(data, end="")
+
+
+# Reused for every Ollama probe so follow-up requests keep the connection alive
+session = requests.Session()
+session.headers.update({"Accept": "application/json"})
+OLLAMA_TIMEOUT_SECONDS = 5
+
+
+def fetch_ollama_tags(host: str = "http://localhost:11434") -> tuple[bool, str, list[dict]]:
     """
-    Check if Ollama is running and accessible.
+    Check if Ollama is running and fetch the list of locally available models.
 
     Args:
         host: Ollama host URL
 
     Returns:
-        Tuple of (is_available, error_message)
+        Tuple of (is_available, error_message, models)
 
     """
     try:
-        response = requests.get(f"{host}/api/tags", timeout=5)
+        response = session.get(f"{host}/api/tags", timeout=OLLAMA_TIMEOUT_SECONDS)
         if response.status_code == 200:
-            return True, ""
-        return False, f"Ollama server responded with status {response.status_code}"  # noqa: TRY300
+            return True, "", json_loads(response.content).get("models", [])
+        return False, f"Ollama server responded with status {response.status_code}", []  # noqa: TRY300
     except requests.exceptions.ConnectionError:
-        return False, "Cannot connect to Ollama server. Is Ollama running?"
+        return False, "Cannot connect to Ollama server. Is Ollama running?", []
     except requests.exceptions.Timeout:
-        return False, "Connection to Ollama server timed out"
+        return False, "Connection to Ollama server timed out", []
     except Exception as e:
-        return False, f"Unexpected error connecting to Ollama: {e}"
+        return False, f"Unexpected error connecting to Ollama: {e}", []
 
 
-def check_model_availability(host: str, model_id: str) -> tuple[bool, str]:
+def check_model_availability(models: list[dict], model_id: str) -> tuple[bool, str]:
     """
-    Check if the specified model is available in Ollama.
+    Check if the specified model is in the list returned by Ollama.
 
     Args:
-        host: Ollama host URL
+        models: Models reported by the Ollama `/api/tags` endpoint
         model_id: Model identifier to check
 
     Returns:
         Tuple of (is_available, error_message)
 
     """
-    try:
-        response = requests.get(f"{host}/api/tags", timeout=5)
-        if response.status_code == 200:
-            models = response.json().get("models", [])
-            available_models = [model["name"] for model in models]
-            if model_id in available_models:
-                return True, ""
-            return False, f"Model '{model_id}' not found. Available models: {', '.join(available_models) if available_models else 'None'}"
-        return False, f"Cannot retrieve model list from Ollama (status {response.status_code})"  # noqa: TRY300
-    except Exception as e:  # noqa: BLE001
-        return False, f"Error checking model availability: {e}"
+    available_models = [model["name"] for model in models]
+    if model_id in available_models:
+        return True, ""
+    return False, f"Model '{model_id}' not found. Available models: {', '.join(available_models) if available_models else 'None'}"
+
+
+def warm_up_model(host: str, model_id: str) -> None:
+    """Ask Ollama to load the model into memory so the first query skips the load time."""
+    # A generate request with an empty prompt only loads the model; failures are ignored
+    # here because the real query reports them
+    with contextlib.suppress(requests.exceptions.RequestException):
+        session.post(f"{host}/api/generate", json={"model": model_id, "prompt": ""}, timeout=60)
 
 
 def create_ollama_agent() -> Agent | None:
@@ -73,23 +99,27 @@ def create_ollama_agent() -> Agent | None:
     host = "http://localhost:11434"
     model_id = "qwen3:8b-q8_0"
 
-    # Check if Ollama is running
-    is_available, error_msg = check_ollama_availability(host)
+    # Check if Ollama is running (a single request also returns the model list)
+    is_available, error_msg, models = fetch_ollama_tags(host)
     if not is_available:
-        rprint(f"[red]❌ Ollama Error:[/red] {error_msg}")
-        rprint("[yellow]💡 To fix this:[/yellow]")
-        rprint("   1. Install Ollama from https://ollama.ai/")
-        rprint("   2. Start Ollama: [cyan]ollama serve[/cyan]")
-        rprint(f"   3. Pull the required model: [cyan]ollama pull {model_id}[/cyan]")
+        console.print(f"[red]❌ Ollama Error:[/red] {error_msg}")
+        console.print("[yellow]💡 To fix this:[/yellow]")
+        console.print("   1. Install Ollama from https://ollama.ai/")
+        console.print("   2. Start Ollama: [cyan]ollama serve[/cyan]")
+        console.print(f"   3. Pull the required model: [cyan]ollama pull {model_id}[/cyan]")
         return None
 
     # Check if the model is available
-    model_available, model_error = check_model_availability(host, model_id)
+    model_available, model_error = check_model_availability(models, model_id)
     if not model_available:
-        rprint(f"[red]❌ Model Error:[/red] {model_error}")
-        rprint(f"[yellow]💡 To fix this:[/yellow] Run [cyan]ollama pull {model_id}[/cyan]")
+        console.print(f"[red]❌ Model Error:[/red] {model_error}")
+        console.print(f"[yellow]💡 To fix this:[/yellow] Run [cyan]ollama pull {model_id}[/cyan]")
         return None
 
+    # Load the model in the background while the agent is set up; set WARMUP=0 to skip
+    if os.environ.get("WARMUP", "1") != "0":
+        threading.Thread(target=warm_up_model, args=(host, model_id), daemon=True).start()
+
     try:
         ollama_model = OllamaModel(
             host=host,
@@ -103,50 +133,53 @@ def create_ollama_agent() -> Agent | None:
             system_prompt="You are a financial analyst assistant specialized in market data analysis.",
             tools=[market_data],
             model=ollama_model,
-            callback_handler=None,  # comment this line to get a full trace
+            callback_handler=stream_text,  # remove this line to also print reasoning and tool calls
         )
 
-        rprint(f"[green]✅ Ollama agent initialized successfully with model {model_id}[/green]")
+        console.print(f"[green]✅ Ollama agent initialized successfully with model {model_id}[/green]")
         return agent  # noqa: TRY300
 
     except Exception as e:  # noqa: BLE001
-        rprint(f"[red]❌ Error creating Ollama agent:[/red] {e}")
+        console.print(f"[red]❌ Error creating Ollama agent:[/red] {e}")
         return None
 
 
-# Initialize agent with error handling
-agent = create_ollama_agent()
-
-
 def main():
     """Main function with error handling for agent execution."""
+    # Initialize agent with error handling; done here so importing never probes Ollama
+    agent = create_ollama_agent()
     if agent is None:
-        rprint("[red]❌ Cannot run analysis: Ollama agent failed to initialize[/red]")
-        rprint("[yellow]Please fix the Ollama setup issues above and try again.[/yellow]")
+        console.print("[red]❌ Cannot run analysis: Ollama agent failed to initialize[/red]")
+        console.print("[yellow]Please fix the Ollama setup issues above and try again.[/yellow]")
         sys.exit(1)
 
     try:
-        rprint("[blue]🔍 Running market data analysis...[/blue]")
+        console.print("[blue]🔍 Running market data analysis...[/blue]")
+        console.print("\n" + "=" * 50 + "\n")
+        console.print("[green]Analysis for AAPL:[/green]")
+        # The answer is printed by `stream_text` as tokens arrive
         result = agent("What's the current trading volume for AAPL?")
 
-        rprint("\n" + "=" * 50 + "\n")
-        rprint(f"[green]Analysis for AAPL:[/green]\n {result.message['content'][0]['text']}")
-        rprint(f"[cyan]Total tokens:[/cyan] {result.metrics.accumulated_usage['totalTokens']}")
-        rprint(f"[cyan]Execution time:[/cyan] {sum(result.metrics.cycle_durations):.2f} seconds")
-        rprint(f"[cyan]Tools used:[/cyan] {list(result.metrics.tool_metrics.keys())}")
-        rprint("\n" + "=" * 50 + "\n")
+        lines = [
+            "\n",
+            f"[cyan]Total tokens:[/cyan] {result.metrics.accumulated_usage['totalTokens']}",
+            f"[cyan]Execution time:[/cyan] {sum(result.metrics.cycle_durations):.2f} seconds",
+            f"[cyan]Tools used:[/cyan] {list(result.metrics.tool_metrics.keys())}",
+            "\n" + "=" * 50 + "\n",
+        ]
+        console.print("\n".join(lines))
 
     except requests.exceptions.ConnectionError:
-        rprint("[red]❌ Connection Error:[/red] Lost connection to Ollama during analysis")
-        rprint("[yellow]💡 Check if Ollama is still running:[/yellow] [cyan]ollama serve[/cyan]")
+        console.print("[red]❌ Connection Error:[/red] Lost connection to Ollama during analysis")
+        console.print("[yellow]💡 Check if Ollama is still running:[/yellow] [cyan]ollama serve[/cyan]")
         sys.exit(1)
     except KeyError as e:
-        rprint(f"[red]❌ Response Format Error:[/red] Unexpected response structure: {e}")
-        rprint("[yellow]This might indicate a model compatibility issue.[/yellow]")
+        console.print(f"[red]❌ Response Format Error:[/red] Unexpected response structure: {e}")
+        console.print("[yellow]This might indicate a model compatibility issue.[/yellow]")
         sys.exit(1)
     except Exception as e:  # noqa: BLE001
-        rprint(f"[red]❌ Analysis Error:[/red] {e}")
-        rprint("[yellow]An unexpected error occurred during analysis.[/yellow]")
+        console.print(f"[red]❌ Analysis Error:[/red] {e}")
+        console.print("[yellow]An unexpected error occurred during analysis.[/yellow]")
         sys.exit(1)
 
 
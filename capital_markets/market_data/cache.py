@@ -0,0 +1,105 @@
+"""
+On-disk TTL cache for market data responses.
+
+Each entry is persisted as a JSON file of the form
+``{"ts": <epoch seconds>, "data": {...}, "etag": <str or null>}`` under the cache directory.
+An in-process dict sits in front of the files so repeated lookups within the same run
+never touch the disk. Expired entries are kept so their ETag can be used to revalidate.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_CACHE_DIR = Path(".cache") / "prices"
+DEFAULT_TTL_SECONDS = 60.0
+
+
+class FileCache:
+    """Time-based cache backed by one JSON file per key."""
+
+    def __init__(self, cache_dir: Path | str = DEFAULT_CACHE_DIR, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+        """
+        Create a cache rooted at ``cache_dir``.
+
+        Args:
+            cache_dir: Directory where cache entries are stored
+            ttl: Number of seconds an entry stays fresh
+
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self._memory: dict[str, dict[str, Any]] = {}
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _is_fresh(self, entry: dict[str, Any]) -> bool:
+        return time.time() - entry["ts"] < self.ttl
+
+    def get_entry(self, key: str) -> dict[str, Any] | None:
+        """
+        Return the raw entry for ``key`` whether or not it has expired.
+
+        Args:
+            key: Cache key (e.g. a ticker symbol)
+
+        Returns:
+            Entry dict with ``ts``, ``data`` and ``etag`` keys, or None if missing
+
+        """
+        entry = self._memory.get(key)
+        if entry is None:
+            try:
+                entry = json.loads(self._path(key).read_text())
+            except (OSError, ValueError):
+                return None
+            self._memory[key] = entry
+        return entry
+
+    def get(self, key: str) -> Any | None:
+        """
+        Return the cached value for ``key``, or None if missing or expired.
+
+        Args:
+            key: Cache key (e.g. a ticker symbol)
+
+        Returns:
+            Cached data if a fresh entry exists, otherwise None
+
+        """
+        entry = self.get_entry(key)
+        if entry is None or not self._is_fresh(entry):
+            return None
+        return entry["data"]
+
+    def set(self, key: str, data: Any, etag: str | None = None) -> None:
+        """
+        Store ``data`` under ``key`` in memory and on disk.
+
+        The file is written to a temporary path and atomically moved into place so
+        concurrent readers never observe a partially written entry.
+
+        Args:
+            key: Cache key (e.g. a ticker symbol)
+            data: JSON-serializable value to cache
+            etag: ETag returned with ``data``, used for conditional requests
+
+        """
+        entry = {"ts": time.time(), "data": data, "etag": etag}
+        self._memory[key] = entry
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Unable to persist cache entry for {key}: {e}")
@@ -8,29 +8,78 @@ and risk assessment, coordinated by a central trading advisor agent.
 """  # noqa: D205
 
 import argparse
-
-from rich import print as rprint
+import asyncio
+import atexit
+import contextlib
+import functools
+import importlib
+import json
+import os
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, get_args
+
+from botocore.config import Config as BotocoreConfig
+from rich.console import Console
 from strands import Agent, tool
+from strands.agent import AgentResult
 from strands.models import BedrockModel
+from strands.telemetry.metrics import EventLoopMetrics, ToolMetrics
+from strands.types.content import Messages
+
+from cache import DEFAULT_TTL_SECONDS, ResultCache, exact_match_cache
 
-# Import tools from respective modules
-from tools.fundamental import calculate_ratios_func, get_company_financials_func
-from tools.risk import calculate_risk_metrics_func, portfolio_impact_analysis_func
-from tools.sentiment import analyze_news_sentiment_func, social_media_trends_func
-from tools.technical import get_price_history_func, identify_patterns_func
+# Shared console; highlighting is off to skip the regex pass over every printed line
+console = Console(highlight=False)
 
 MODEL_ID = "us.anthropic.claude-3-7-sonnet-20250219-v1:0"
 
+# Region used for every agent's Bedrock model; the CLI sets this from --region before
+# any agent is created
+bedrock_region = "us-west-2"
+
+# Shared client settings: a connection pool large enough for a full batch fan-out
+# (coordinators plus every analyst thread) so concurrent calls reuse warm connections,
+# TCP keep-alive, and adaptive retries for throttling
+BEDROCK_CLIENT_CONFIG = BotocoreConfig(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+
+# Bedrock models by region. The lock makes sure the warm-up thread and the analyst threads
+# that ask for a model at the same moment all get the same one.
+bedrock_models: dict[str, BedrockModel] = {}
+bedrock_models_lock = threading.Lock()
+
 
 def setup_bedrock_model(region_name: str = "us-west-2") -> BedrockModel:
-    """Configure and return a Bedrock model."""
-    # Create a Bedrock model
-    return BedrockModel(
-        model_id=MODEL_ID,
-        region_name=region_name,
-        temperature=0.1,
-        top_p=0.5,
-    )
+    """Configure and return a Bedrock model, built once per region."""
+    with bedrock_models_lock:
+        if region_name not in bedrock_models:
+            # Create a Bedrock model
+            bedrock_models[region_name] = BedrockModel(
+                model_id=MODEL_ID,
+                region_name=region_name,
+                temperature=0.1,
+                top_p=0.5,
+                boto_client_config=BEDROCK_CLIENT_CONFIG,
+                # boto_session=session  # Optional: Use a custom boto3 session
+            )
+        return bedrock_models[region_name]
+
+
+def warm_up_model(region_name: str) -> None:
+    """Build the region's model and send a one-token request, so credentials, client, and TLS are ready for the first query."""
+    # Best effort: any real problem (e.g. missing credentials) surfaces on the actual call
+    with contextlib.suppress(Exception):
+        setup_bedrock_model(region_name).client.converse(
+            modelId=MODEL_ID,
+            messages=[{"role": "user", "content": [{"text": "ping"}]}],
+            inferenceConfig={"maxTokens": 1},
+        )
 
 
 # System prompts for different agent types
@@ -104,6 +153,133 @@ Make balanced decisions that consider all available information.
 Always explain your reasoning and acknowledge areas of uncertainty.
 """
 
+# Appended to the coordinator prompt when the advisor consults specialists through tools
+SPECIALIST_TOOL_PROMPT = """
+Consult specialists through run_specialists, listing every specialty you need in a single
+call so that they run in parallel.
+"""
+
+# ========================
+# SPECIALIZED AGENTS
+# ========================
+
+# Prompt, tool module, and tool names for each specialist agent, keyed by specialty.
+# Tool modules (and NumPy behind them) are imported when a specialist is first built,
+# so `--help` and cached runs skip them.
+SPECIALIST_CONFIG = {
+    "fundamental": (FUNDAMENTAL_ANALYSIS_PROMPT, "tools.fundamental", ("get_company_financials_func", "calculate_ratios_func")),
+    "technical": (TECHNICAL_ANALYSIS_PROMPT, "tools.technical", ("get_price_history_func", "identify_patterns_func")),
+    "sentiment": (SENTIMENT_ANALYSIS_PROMPT, "tools.sentiment", ("analyze_news_sentiment_func", "social_media_trends_func")),
+    "risk": (RISK_ASSESSMENT_PROMPT, "tools.risk", ("calculate_risk_metrics_func", "portfolio_impact_analysis_func")),
+}
+
+# Agents hold conversation state and are not safe to share between threads, so each
+# worker thread builds its own specialists. They all share the cached BedrockModel,
+# whose boto3 client is thread-safe.
+specialist_agents = threading.local()
+
+# Tickers analyzed at the same time in a batch, to stay within Bedrock request limits
+MAX_CONCURRENT_ANALYSES = 8
+
+# Worker threads for specialist fan-out, shared so each call skips thread startup.
+# Sized for every specialist of every ticker in a full batch, so batch runs do not queue
+# specialists behind each other.
+analyst_pool = ThreadPoolExecutor(max_workers=len(SPECIALIST_CONFIG) * MAX_CONCURRENT_ANALYSES, thread_name_prefix="analyst")
+atexit.register(analyst_pool.shutdown, wait=True)
+
+
+def get_specialist_agent(specialty: str) -> Agent:
+    """
+    Return the calling thread's specialist agent, building it on first use.
+
+    Specialist output is not streamed to the console since they may run in parallel.
+    """
+    if not hasattr(specialist_agents, "by_specialty"):
+        specialist_agents.by_specialty = {}
+    if specialty not in specialist_agents.by_specialty:
+        system_prompt, module_name, tool_names = SPECIALIST_CONFIG[specialty]
+        module = importlib.import_module(module_name)
+        tools = [getattr(module, name) for name in tool_names]
+        specialist_agents.by_specialty[specialty] = Agent(
+            system_prompt=system_prompt,
+            tools=tools,
+            model=setup_bedrock_model(bedrock_region),
+            callback_handler=None,
+        )
+    return specialist_agents.by_specialty[specialty]
+
+
+def run_specialist(specialty: str, query: str) -> AgentResult:
+    """Run a query on this thread's specialist agent, starting from an empty conversation."""
+    agent = get_specialist_agent(specialty)
+    agent.messages.clear()
+    # The result shares the agent's metrics object, so give each run its own rather than a
+    # running total for every query this thread has handled
+    agent.event_loop_metrics = EventLoopMetrics()
+    return agent(query)
+
+
+# A coordinator may ask a specialist the same question more than once in a session;
+# identical (specialty, query) pairs reuse the earlier answer for 10 minutes
+@exact_match_cache(ttl=600)
+async def run_specialist_async(specialty: str, query: str) -> AgentResult:
+    """Run a specialist on the shared analyst pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(analyst_pool, run_specialist, specialty, query)
+    # Recorded here rather than by the callers, so answers served from the cache are not counted again
+    record_specialist_metrics(specialty, result)
+    return result
+
+
+# Print each specialist's metrics as it finishes; set TRADING_DEBUG=1 or pass --verbose.
+# Otherwise they are only collected, and summarized once at the end of a CLI run.
+verbose = os.environ.get("TRADING_DEBUG", "0") != "0"
+
+# (specialty, result) for every specialist call made in this process
+specialist_metrics: list[tuple[str, AgentResult]] = []
+
+
+def record_specialist_metrics(specialty: str, result: AgentResult) -> None:
+    """Collect a specialist's metrics for the end-of-run summary, printing them in verbose mode."""
+    specialist_metrics.append((specialty, result))
+    if verbose:
+        console.print(f"\n=== {specialty.title()} Analysis Metrics ===\n{format_metrics(result)}")
+
+
+def render_specialist_metrics() -> None:
+    """Print one table summarizing the collected specialist metrics, by specialty."""
+    # Console rendering helpers are imported where used to keep CLI start-up fast
+    from rich.table import Table  # noqa: PLC0415
+
+    totals: dict[str, tuple[int, int, float]] = {}
+    for specialty, result in specialist_metrics:
+        calls, tokens, seconds = totals.get(specialty, (0, 0, 0.0))
+        totals[specialty] = (
+            calls + 1,
+            tokens + result.metrics.accumulated_usage["totalTokens"],
+            seconds + sum(result.metrics.cycle_durations),
+        )
+
+    table = Table(title="Specialist Metrics", show_header=True, header_style="bold magenta")
+    table.add_column("Specialist", style="dim")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total tokens", justify="right")
+    table.add_column("Execution time", justify="right")
+    for specialty, (calls, tokens, seconds) in totals.items():
+        table.add_row(specialty.title(), str(calls), str(tokens), f"{seconds:.2f} seconds")
+    console.print(table)
+
+
+def format_metrics(result: AgentResult) -> str:
+    """Format token usage, execution time, and tools used as one printable block."""
+    lines = [
+        f"Total tokens: {result.metrics.accumulated_usage['totalTokens']}",
+        f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds",
+        f"Tools used: {list(result.metrics.tool_metrics.keys())}",
+    ]
+    return "\n".join(lines)
+
+
 # ========================
 # SPECIALIZED AGENT TOOLS
 # ========================
@@ -111,131 +287,405 @@ Always explain your reasoning and acknowledge areas of uncertainty.
 
 # fundamental analysis agent as tool
 @tool
-def fundamental_analyst(query: str) -> str:
+async def fundamental_analyst(query: str) -> str:
     """Process fundamental analysis questions using specialized agent."""
-    model = setup_bedrock_model()
-    analysis_agent = Agent(
-        system_prompt=FUNDAMENTAL_ANALYSIS_PROMPT,
-        tools=[get_company_financials_func, calculate_ratios_func],
-        model=model,
-    )
     try:
-        result = analysis_agent(query)
-        rprint("=== Fundamental Analysis Metrics ===")
-        rprint(f"Total tokens: {result.metrics.accumulated_usage['totalTokens']}")
-        rprint(f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds")
-        rprint(f"Tools used: {list(result.metrics.tool_metrics.keys())}")
-        return result
+        return await run_specialist_async("fundamental", query)
     except Exception as e:
         return f"Fundamental analysis error: {e!s}"
 
 
 # technical analysis agent as tool
 @tool
-def technical_analyst(query: str) -> str:
+async def technical_analyst(query: str) -> str:
     """Process technical analysis questions using specialized agent."""
-    model = setup_bedrock_model()
-    tech_agent = Agent(
-        system_prompt=TECHNICAL_ANALYSIS_PROMPT,
-        tools=[get_price_history_func, identify_patterns_func],
-        model=model,
-    )
     try:
-        result = tech_agent(query)
-        rprint("\n=== Technical Analysis Metrics ===")
-        rprint(f"Total tokens: {result.metrics.accumulated_usage['totalTokens']}")
-        rprint(f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds")
-        rprint(f"Tools used: {list(result.metrics.tool_metrics.keys())}")
-        return result
+        return await run_specialist_async("technical", query)
     except Exception as e:
         return f"Technical analysis error: {e!s}"
 
 
 # sentiment analysis agent as tool
 @tool
-def sentiment_analyst(query: str) -> str:
+async def sentiment_analyst(query: str) -> str:
     """Process sentiment analysis questions using specialized agent."""
-    model = setup_bedrock_model()
-    sentiment_agent = Agent(
-        system_prompt=SENTIMENT_ANALYSIS_PROMPT,
-        tools=[analyze_news_sentiment_func, social_media_trends_func],
-        model=model,
-    )
     try:
-        result = sentiment_agent(query)
-        rprint("\n=== Sentiment Analysis Metrics ===")
-        rprint(f"Total tokens: {result.metrics.accumulated_usage['totalTokens']}")
-        rprint(f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds")
-        rprint(f"Tools used: {list(result.metrics.tool_metrics.keys())}")
-        return result
+        return await run_specialist_async("sentiment", query)
     except Exception as e:
         return f"Sentiment analysis error: {e!s}"
 
 
 # risk assessment agent as tool
 @tool
-def risk_analyst(query: str) -> str:
+async def risk_analyst(query: str) -> str:
     """Process risk assessment questions using specialized agent."""
-    model = setup_bedrock_model()
-    risk_agent = Agent(
-        system_prompt=RISK_ASSESSMENT_PROMPT,
-        tools=[calculate_risk_metrics_func, portfolio_impact_analysis_func],
-        model=model,
-    )
     try:
-        result = risk_agent(query)
-        rprint("\n=== Risk Analysis Metrics ===")
-        rprint(f"Total tokens: {result.metrics.accumulated_usage['totalTokens']}")
-        rprint(f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds")
-        rprint(f"Tools used: {list(result.metrics.tool_metrics.keys())}")
-        return result
+        return await run_specialist_async("risk", query)
     except Exception as e:
         return f"Risk analysis error: {e!s}"
 
 
-# Create the main coordinator agent
-trading_advisor: Agent = Agent(
-    name="Trading Advisor Coordinator",
-    system_prompt=TRADING_COORDINATOR_PROMPT,
-    tools=[fundamental_analyst, technical_analyst, sentiment_analyst, risk_analyst],
-    model=setup_bedrock_model(),
-)
+SPECIALISTS = {
+    "fundamental": fundamental_analyst,
+    "technical": technical_analyst,
+    "sentiment": sentiment_analyst,
+    "risk": risk_analyst,
+}
 
+# Specialties the coordinator can request from `run_specialists`
+Specialty = Literal["fundamental", "technical", "sentiment", "risk"]
 
-# Example usage functions
-def analyze_stock(ticker: str, analysis_type: str = "comprehensive") -> str:
+# A new specialist needs an entry in all three; catch a missing one at import time
+assert set(get_args(Specialty)) == set(SPECIALIST_CONFIG) == set(SPECIALISTS), "SPECIALIST_CONFIG, SPECIALISTS, and Specialty disagree"
+
+
+# specialists as a single tool, run in parallel
+@tool
+async def run_specialists(
+    query: str,
+    specialties: list[Specialty] | None = None,
+) -> dict:
     """
-    Analyze a stock using the multi-agent system.
+    Run specialist analysts concurrently on the same query.
 
     Args:
-        ticker: Stock ticker symbol
-        analysis_type: Type of analysis ('fundamental', 'technical', 'sentiment', 'risk', 'comprehensive')
+        query: The analysis question for the specialists
+        specialties: Specialists to consult; all four when omitted
+
+    Returns:
+        Each specialist's analysis keyed by specialty; an error tool result carrying the same
+        analyses when any specialist failed
 
     """
-    queries = {
-        "fundamental": f"Provide a fundamental analysis of {ticker} including valuation, growth prospects, and investment recommendation.",
-        "technical": f"Analyze the technical setup for {ticker} including chart patterns, indicators, and entry/exit points.",
-        "sentiment": f"Assess the current market sentiment for {ticker} based on news and social media trends.",
-        "risk": f"Evaluate the risk profile of {ticker} including market risk, volatility, and portfolio impact.",
-        "comprehensive": f"Should I buy {ticker} shares? Provide a comprehensive analysis covering fundamentals, technicals, sentiment, and risk factors.",
+    names = list(dict.fromkeys(specialties)) if specialties else list(SPECIALISTS)
+    # Each specialist is an independent Bedrock round-trip, so total time is ~max, not sum
+    results = await asyncio.gather(*(run_specialist_async(name, query) for name in names), return_exceptions=True)
+    analyses = {
+        name: f"{name.title()} analysis error: {result!s}" if isinstance(result, Exception) else str(result)
+        for name, result in zip(names, results, strict=True)
     }
+    if any(isinstance(result, Exception) for result in results):
+        # The coordinator still sees the analyses that succeeded, but the error status marks its
+        # answer as partial so `stream_stock_analysis` does not cache it
+        return {"status": "error", "content": [{"text": str(analyses)}]}
+    return analyses
+
+
+def specialists_failed(messages: Messages) -> bool:
+    """Return whether any tool call in ``messages``, such as `run_specialists`, reported an error."""
+    return any(block.get("toolResult", {}).get("status") == "error" for message in messages for block in message["content"])
+
+
+def create_trading_advisor() -> Agent:
+    """Create a trading advisor coordinator agent."""
+    return Agent(
+        name="Trading Advisor Coordinator",
+        system_prompt=TRADING_COORDINATOR_PROMPT + SPECIALIST_TOOL_PROMPT,
+        # Only the batch tool is exposed, so the coordinator cannot serialize specialist calls
+        tools=[run_specialists],
+        model=setup_bedrock_model(bedrock_region),
+        # Callers render the response from the event stream
+        callback_handler=None,
+    )
+
+
+# Create the main coordinator agent on first use, so importing this module or
+# running `--help` does not build any Bedrock clients
+@functools.lru_cache(maxsize=1)
+def get_trading_advisor() -> Agent:
+    """Return the shared trading advisor coordinator agent."""
+    return create_trading_advisor()
+
+
+# Query sent to the trading advisor for each analysis type
+QUERY_TEMPLATES = {
+    "fundamental": "Provide a fundamental analysis of {ticker} including valuation, growth prospects, and investment recommendation.",
+    "technical": "Analyze the technical setup for {ticker} including chart patterns, indicators, and entry/exit points.",
+    "sentiment": "Assess the current market sentiment for {ticker} based on news and social media trends.",
+    "risk": "Evaluate the risk profile of {ticker} including market risk, volatility, and portfolio impact.",
+    "comprehensive": "Should I buy {ticker} shares? Provide a comprehensive analysis covering fundamentals, technicals, sentiment, and risk factors.",
+}
+
+
+def merge_metrics(metrics: EventLoopMetrics, others: list[EventLoopMetrics]) -> None:
+    """Add the token usage, cycle durations, and tool metrics of ``others`` to ``metrics``."""
+    for other in others:
+        for key, value in other.accumulated_usage.items():
+            metrics.accumulated_usage[key] = metrics.accumulated_usage.get(key, 0) + value
+        metrics.cycle_durations.extend(other.cycle_durations)
+        for name, tool_metrics in other.tool_metrics.items():
+            metrics.tool_metrics.setdefault(name, tool_metrics)
+
+
+# Final request for a comprehensive analysis, after every specialist has reported
+SYNTHESIS_TEMPLATE = """Should I buy {ticker} shares? Using the specialist analyses below, provide a comprehensive \
+recommendation covering fundamentals, technicals, sentiment, and risk factors.
+
+{analyses}"""
+
+
+async def stream_comprehensive_analysis(ticker: str) -> AsyncIterator[dict[str, Any]]:
+    """
+    Run all four specialists directly, then stream the advisor's synthesis of their answers.
 
-    query = queries.get(analysis_type, queries["comprehensive"])
+    A comprehensive analysis always needs every specialist, so this skips the coordinator's
+    tool-planning turn: the specialists run concurrently on their own query templates and
+    the advisor receives their analyses in a single prompt, with no tools.
 
+    Args:
+        ticker: Stock ticker symbol
+
+    Yields:
+        Agent stream events from the synthesis step; the final result's metrics also include the
+        specialists' token usage, cycle durations, and tools, so they cover the whole analysis
+
+    Raises:
+        RuntimeError: If any specialist fails, before the synthesis starts
+
+    """
+    analyses = await asyncio.gather(
+        *(run_specialist_async(name, QUERY_TEMPLATES[name].format(ticker=ticker)) for name in SPECIALISTS),
+        return_exceptions=True,
+    )
+    # A recommendation built on a missing analysis would be cached and replayed as if it were
+    # complete, so any specialist failure fails the whole analysis
+    failures = [f"{name} ({analysis!s})" for name, analysis in zip(SPECIALISTS, analyses, strict=True) if isinstance(analysis, Exception)]
+    if failures:
+        raise RuntimeError(f"specialist analysis failed: {', '.join(failures)}")
+    sections = "\n\n".join(f"{name.upper()} ANALYSIS:\n{str(analysis).strip()}" for name, analysis in zip(SPECIALISTS, analyses, strict=True))
+    # A fresh tool-free agent per call, so concurrent batch analyses never share conversation state
+    synthesizer = Agent(
+        name="Trading Advisor Synthesizer",
+        system_prompt=TRADING_COORDINATOR_PROMPT,
+        model=setup_bedrock_model(bedrock_region),
+        callback_handler=None,
+    )
+    async for event in synthesizer.stream_async(SYNTHESIS_TEMPLATE.format(ticker=ticker, analyses=sections)):
+        if "result" in event:
+            merge_metrics(event["result"].metrics, [analysis.metrics for analysis in analyses])
+        yield event
+
+
+# Finished analyses keyed by model, ticker, and analysis type; valid for 30 minutes unless
+# the CLI's --cache-ttl says otherwise
+result_cache = ResultCache()
+
+
+def analysis_cache_key(ticker: str, analysis_type: str) -> str:
+    """Return the `result_cache` key for an analysis; answers from a different model never match."""
+    return f"{MODEL_ID}|{ticker}|{analysis_type}"
+
+
+def result_to_json(result: AgentResult) -> bytes:
+    """Serialize the parts of an agent result that are needed to display it again."""
+    return json.dumps(
+        {
+            "stop_reason": result.stop_reason,
+            "message": result.message,
+            "accumulated_usage": result.metrics.accumulated_usage,
+            "cycle_durations": result.metrics.cycle_durations,
+            "tools_used": list(result.metrics.tool_metrics.keys()),
+        },
+    ).encode()
+
+
+def result_from_json(value: bytes) -> AgentResult:
+    """Rebuild an agent result from the output of `result_to_json`."""
+    data = json.loads(value)
+    metrics = EventLoopMetrics(
+        tool_metrics={name: ToolMetrics(tool={"toolUseId": "", "name": name, "input": {}}) for name in data["tools_used"]},
+        cycle_durations=data["cycle_durations"],
+        accumulated_usage=data["accumulated_usage"],
+    )
+    return AgentResult(data["stop_reason"], data["message"], metrics, state={})
+
+
+# Example usage functions
+async def stream_stock_analysis(
+    ticker: str,
+    analysis_type: str = "comprehensive",
+    use_cache: bool = True,
+    advisor: Agent | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Analyze a stock using the multi-agent system, yielding events as the answer is generated.
+
+    Args:
+        ticker: Stock ticker symbol
+        analysis_type: Type of analysis ('fundamental', 'technical', 'sentiment', 'risk', 'comprehensive')
+        use_cache: Return a cached result for the same ticker and analysis type when available
+        advisor: Coordinator agent for single-specialty analyses; defaults to the shared trading advisor
+
+    Yields:
+        Agent stream events: ``{"data": <text chunk>}`` as tokens arrive, and finally
+        ``{"result": <AgentResult or error message>}``
+
+    """
+    # Normalize once so the query, the result cache, and the mock data all see the same symbol
+    ticker = ticker.upper()
+    if analysis_type not in QUERY_TEMPLATES:
+        analysis_type = "comprehensive"
+    query = QUERY_TEMPLATES[analysis_type].format(ticker=ticker)
+
+    cache_key = analysis_cache_key(ticker, analysis_type)
+    if use_cache:
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            try:
+                result = result_from_json(cached)
+            except (KeyError, TypeError, ValueError) as e:
+                # A damaged entry, or one written in an older format: run the analysis again
+                console.print(f"Ignoring unreadable cached {analysis_type} analysis for {ticker}: {e!s}")
+            else:
+                console.print(f"Using cached {analysis_type} analysis for {ticker}")
+                yield {"result": result}
+                return
+
+    result = None
+    partial = False
     try:
-        response = trading_advisor(query)
-        return response
+        if analysis_type == "comprehensive":
+            # Fails outright if any specialist fails, so a finished result is always complete
+            events = stream_comprehensive_analysis(ticker)
+        else:
+            advisor = advisor or get_trading_advisor()
+            first_message = len(advisor.messages)
+            events = advisor.stream_async(query)
+        async for event in events:
+            if "result" in event:
+                result = event["result"]
+                partial = analysis_type != "comprehensive" and specialists_failed(advisor.messages[first_message:])
+            yield event
     except Exception as e:
-        return f"Analysis error: {e!s}"
+        yield {"result": f"Analysis error: {e!s}"}
+        return
+
+    # Cache only after the result has been handed over, so a cache problem never costs the caller
+    # a finished analysis
+    if result is None:
+        return
+    if partial:
+        console.print(f"Not caching the {analysis_type} analysis for {ticker}: a specialist failed")
+        return
+    try:
+        result_cache.set(cache_key, result_to_json(result))
+    except (TypeError, ValueError) as e:
+        console.print(f"Unable to cache the {analysis_type} analysis for {ticker}: {e!s}")
+
+
+async def analyze_stock_async(
+    ticker: str,
+    analysis_type: str = "comprehensive",
+    use_cache: bool = True,
+    advisor: Agent | None = None,
+) -> AgentResult | str:
+    """
+    Analyze a stock using the multi-agent system; see `stream_stock_analysis`.
+
+    Returns:
+        The advisor's result, or an error message if the analysis failed
+
+    """
+    result = None
+    async for event in stream_stock_analysis(ticker, analysis_type, use_cache, advisor):
+        if "result" in event:
+            result = event["result"]
+    return result
+
+
+def analyze_stock(ticker: str, analysis_type: str = "comprehensive", use_cache: bool = True) -> AgentResult | str:
+    """Analyze a stock using the multi-agent system; see `analyze_stock_async`."""
+    return asyncio.run(analyze_stock_async(ticker, analysis_type, use_cache))
 
 
-# def batch_analysis(tickers: list[str], analysis_type: str = "comprehensive") -> dict[str, str]:
-#     """Perform comprehensive analysis on multiple stocks."""
-#     results = {}
-#     for ticker in tickers:
-#         rprint(f"Analyzing {ticker}...")
-#         results[ticker] = analyze_stock(ticker, analysis_type)
-#     return results
+async def batch_analysis_async(
+    tickers: list[str],
+    analysis_type: str = "comprehensive",
+    use_cache: bool = True,
+    max_concurrency: int = MAX_CONCURRENT_ANALYSES,
+) -> dict[str, AgentResult | str]:
+    """
+    Analyze several stocks concurrently, showing a progress bar.
+
+    Args:
+        tickers: Stock ticker symbols
+        analysis_type: Type of analysis to run for every ticker
+        use_cache: Return cached results when available
+        max_concurrency: Maximum number of tickers analyzed at once
+
+    Returns:
+        Each ticker's result (or error message), in the order given
+
+    """
+    from rich.progress import (  # noqa: PLC0415
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task(f"Analyzing {len(tickers)} tickers", total=len(tickers))
+
+        async def analyze(ticker: str) -> AgentResult | str:
+            async with semaphore:
+                # Agents hold conversation state, so each ticker gets its own coordinator; comprehensive
+                # analyses synthesize with their own agent and need none
+                advisor = None if analysis_type == "comprehensive" else create_trading_advisor()
+                result = await analyze_stock_async(ticker, analysis_type, use_cache, advisor)
+            progress.advance(task)
+            return result
+
+        results = await asyncio.gather(*(analyze(ticker) for ticker in tickers))
+
+    return dict(zip(tickers, results, strict=True))
+
+
+def print_analysis(ticker: str, result: AgentResult | str) -> None:
+    """Print an analysis result followed by its metrics."""
+    console.print(f"Analysis for {ticker}:")
+    if isinstance(result, str):
+        console.print(result, markup=False)
+        return
+    # Write the (long) model output as-is, without rich markup parsing or highlighting
+    console.out(result.message["content"][0]["text"], highlight=False)
+    console.print(f"{format_metrics(result)}\n\n{'=' * 50}\n")
+
+
+async def stream_analysis_to_console(ticker: str, analysis_type: str, use_cache: bool = True) -> AgentResult | str:
+    """Analyze a stock, rendering the advisor's answer live as tokens arrive, then print its metrics."""
+    from rich.live import Live  # noqa: PLC0415
+    from rich.text import Text  # noqa: PLC0415
+
+    console.print(f"Analysis for {ticker}:")
+    text = ""
+    result = None
+    # While streaming, answers taller than the terminal are cut off with an ellipsis, since rich
+    # cannot redraw lines that have scrolled away; Live prints the final frame in full on exit
+    with Live(Text(text), console=console, refresh_per_second=8) as live:
+        async for event in stream_stock_analysis(ticker, analysis_type, use_cache):
+            if "data" in event:
+                text += event["data"]
+                live.update(Text(text))
+            elif "result" in event:
+                result = event["result"]
+        # Settle on the final message, without any text streamed before tool calls
+        live.update(Text(result if isinstance(result, str) else result.message["content"][0]["text"]))
+    if not isinstance(result, str):
+        console.print(f"\n{format_metrics(result)}\n\n{'=' * 50}\n")
+    return result
 
 
 # Example usage and testing
@@ -244,7 +694,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Trading Analysis System")
     parser.add_argument(
         "ticker",
-        type=str,
+        type=str.upper,
         nargs="+",
         help="Stock ticker symbol(s) to analyze (e.g., AAPL MSFT)",
     )
@@ -262,40 +712,56 @@ if __name__ == "__main__":
         default="us-west-2",
         help="AWS region for Bedrock (default: us-west-2)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and run a fresh analysis",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_TTL_SECONDS,
+        help=f"Seconds a cached result stays valid (default: {DEFAULT_TTL_SECONDS})",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Print each specialist's metrics as it finishes",
+    )
     # Local model support removed - using Bedrock only
 
     args = parser.parse_args()
 
-    # Optional: Create a custom boto3 session
-    # session = boto3.Session(
-    #     aws_access_key_id="your_access_key",
-    #     aws_secret_access_key="your_secret_key",
-    #     aws_session_token="your_session_token",  # If using temporary credentials
-    #     region_name="us-west-2",
-    #     profile_name="your-profile",  # Optional: Use a specific profile
-    # )
-
-    # Create a Bedrock model with the custom session
-    bedrock_model = BedrockModel(
-        model_id=MODEL_ID,
-        region_name=args.region,
-        temperature=0.1,
-        top_p=0.5,
-        # boto_session=session  # Optional: Use a custom boto3 session
-    )
+    # Agents are built lazily, so every one of them picks up the requested region
+    bedrock_region = args.region
+    verbose = verbose or args.verbose
+    result_cache.ttl = args.cache_ttl
+    use_cache = not args.no_cache
+
+    # Unless every answer is already cached, warm the Bedrock client in the background while the
+    # tool modules load, so the first specialist call finds it ready; set WARMUP=0 to skip the
+    # extra one-token request
+    all_cached = use_cache and all(result_cache.get(analysis_cache_key(ticker, args.type)) is not None for ticker in args.ticker)
+    if os.environ.get("WARMUP", "1") != "0" and not all_cached:
+        threading.Thread(target=warm_up_model, args=(bedrock_region,), daemon=True).start()
 
     # print passed in args
-    rprint(f"Ticker: {args.ticker[0]}")
-    rprint(f"Analysis Type: {args.type}")
-    rprint(f"Region: {args.region}")
-
-    # Single stock analysis
-    rprint("\n" + "=" * 50 + "\n")
-    rprint("=== Single Stock Analysis ===")
-    result = analyze_stock(args.ticker[0], args.type)
-    # rprint(result.messages)
-    rprint(f"Analysis for {args.ticker[0]}:\n {result.message['content'][0]['text']}")
-    rprint(f"Total tokens: {result.metrics.accumulated_usage['totalTokens']}")
-    rprint(f"Execution time: {sum(result.metrics.cycle_durations):.2f} seconds")
-    rprint(f"Tools used: {list(result.metrics.tool_metrics.keys())}")
-    rprint("\n" + "=" * 50 + "\n")
+    console.print(f"Ticker: {', '.join(args.ticker)}")
+    console.print(f"Analysis Type: {args.type}")
+    console.print(f"Region: {args.region}")
+
+    console.print("\n" + "=" * 50 + "\n")
+    if len(args.ticker) == 1:
+        # Single stock analysis, streamed to the console as it is generated
+        console.print("=== Single Stock Analysis ===")
+        asyncio.run(stream_analysis_to_console(args.ticker[0], args.type, use_cache=use_cache))
+    else:
+        # Multiple stocks: each ticker is an independent trace, so run them concurrently
+        console.print("=== Batch Stock Analysis ===")
+        results = asyncio.run(batch_analysis_async(args.ticker, args.type, use_cache=use_cache))
+        for ticker, result in results.items():
+            print_analysis(ticker, result)
+
+    if specialist_metrics:
+        render_specialist_metrics()
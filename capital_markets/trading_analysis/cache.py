@@ -0,0 +1,198 @@
+"""
+Caches for trading analysis results.
+
+`ResultCache` stores results in a SQLite database so repeated analyses of the same ticker
+and analysis type can be served across runs without calling Bedrock again. Each row holds
+the SHA-256 of the key, the serialized value (zstd-compressed when the optional
+``zstandard`` package is installed), and the epoch time at which it was written. Entries
+expire by the cache's current TTL, so changing it applies to entries already stored.
+
+`exact_match_cache` is an in-process cache for async calls with identical arguments, such
+as a coordinator asking a specialist the same question twice.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; values are then stored uncompressed
+    zstandard = None
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "trading_analysis" / "cache.db"
+DEFAULT_TTL_SECONDS = 1800
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB, created_at INTEGER)"
+
+ZSTD_LEVEL = 3
+# Every zstd frame starts with this magic number, so compressed and plain values can coexist
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class ResultCache:
+    """Key/value cache with per-entry expiry, backed by SQLite."""
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+        """
+        Create a cache stored at ``path``.
+
+        Args:
+            path: Location of the SQLite database file
+            ttl: Number of seconds an entry stays valid, counted from when it was written
+
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the cache safe to use from worker threads
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute(SCHEMA)
+        return conn
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @staticmethod
+    def _compress(value: bytes) -> bytes:
+        if zstandard is None:
+            return value
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(value)
+
+    @staticmethod
+    def _decompress(value: bytes) -> bytes | None:
+        if not value.startswith(ZSTD_MAGIC):
+            return value
+        if zstandard is None:
+            # Written by an install with zstandard; unreadable here, so treat it as a miss
+            return None
+        try:
+            return zstandard.ZstdDecompressor().decompress(value)
+        except zstandard.ZstdError:
+            # A damaged entry is treated as a miss
+            return None
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the value stored under ``key``, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if a valid entry exists, otherwise None
+
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value FROM results WHERE key = ? AND created_at > ?",
+                    (self._digest(key), int(time.time()) - self.ttl),
+                ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Unable to read cache entry {key}: {e}")
+            return None
+        return self._decompress(row[0]) if row else None
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store ``value`` under ``key``, replacing any existing entry.
+
+        Args:
+            key: Cache key
+            value: Serialized value to store
+
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (key, value, created_at) VALUES (?, ?, ?)",
+                    (self._digest(key), self._compress(value), int(time.time())),
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Unable to write cache entry {key}: {e}")
+
+
+def exact_match_cache(
+    ttl: float = 600,
+    maxsize: int = 256,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the results of an async function, keyed by a SHA-256 of its arguments.
+
+    Only returned values are cached; calls that raise are retried next time. Entries
+    expire after ``ttl`` seconds, and the least recently used entry is dropped once
+    ``maxsize`` is reached. Identical calls made while one is still running wait for it
+    instead of starting their own.
+
+    Results are shared across event loops, so the function must return plain values
+    rather than objects bound to the loop that produced them.
+
+    Args:
+        ttl: Seconds a result stays valid
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Decorator for an async function whose arguments have stable ``str`` forms
+
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # Calls still running, by key. These are concurrent.futures futures rather than asyncio
+        # ones, so a caller on any event loop can wait for them.
+        in_flight: dict[str, concurrent.futures.Future] = {}
+        # Guards entries and in_flight, since the decorated function may be awaited from several event loops
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            signature = "|".join([*map(str, args), *(f"{name}={value}" for name, value in sorted(kwargs.items()))])
+            key = hashlib.sha256(signature.encode()).hexdigest()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and time.monotonic() - entry[0] < ttl:
+                    entries.move_to_end(key)
+                    return entry[1]
+                pending = in_flight.get(key)
+                running = pending is not None
+                if not running:
+                    pending = in_flight[key] = concurrent.futures.Future()
+
+            if running:
+                # Shielded, so a waiter that is cancelled does not cancel the call it shares
+                return await asyncio.shield(asyncio.wrap_future(pending))
+
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    del in_flight[key]
+                pending.set_exception(e)
+                raise
+            with lock:
+                del in_flight[key]
+                entries[key] = (time.monotonic(), result)
+                entries.move_to_end(key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            pending.set_result(result)
+            return result
+
+        return wrapper
+
+    return decorator
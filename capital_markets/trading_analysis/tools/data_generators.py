@@ -3,12 +3,299 @@ Mock data generators for financial analysis.
 
 This module contains functions to generate mock data for different types of financial analysis.
 In a production environment, these would be replaced with real API calls to financial data providers.
+
+Each generator has a ``*_batch`` variant that draws the random values for all tickers in a few
+vectorized NumPy calls; the single-ticker functions are thin wrappers around it. Records also
+carry the derived display values the reports need (``*_pct`` percentages, ``market_cap_b``,
+title-cased ``*_title`` labels), so they are computed once per ticker rather than on every
+tool call.
+
+The single-ticker functions draw from a generator seeded by the ticker, so the same ticker
+always produces the same data, in every run and every thread. They are also memoized, and
+return read-only mappings since every caller shares the cached result. `clear_mock_caches`
+drops the memoized results and the reports rendered from them; the data drawn again
+afterwards is the same.
 """
 
+import functools
 import random
+import zlib
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+
+from tools.results import clear_render_caches
+
+# Generator for batch draws when the caller does not supply one
+shared_rng = np.random.default_rng()
+
+# Uniform (low, high) range for each numeric field
+FINANCIAL_RANGES = {
+    "market_cap": (50e9, 2e12),  # $50B to $2T
+    "pe_ratio": (10, 35),
+    "revenue_growth": (-0.1, 0.3),  # -10% to 30%
+    "profit_margin": (0.05, 0.25),  # 5% to 25%
+    "debt_to_equity": (0.1, 2.0),
+    "roe": (0.08, 0.25),  # 8% to 25%
+    "current_ratio": (1.0, 3.0),
+}
+
+# Ranges for technical data; all but current_price and rsi are multiples of current_price
+TECHNICAL_RANGES = {
+    "current_price": (50, 500),
+    "sma_50": (0.95, 1.05),
+    "sma_200": (0.90, 1.10),
+    "rsi": (20, 80),
+    "support_level": (0.85, 0.95),
+    "resistance_level": (1.05, 1.15),
+}
+PRICE_RELATIVE_FIELDS = ("sma_50", "sma_200", "support_level", "resistance_level")
+
+SENTIMENT_RANGES = {
+    "news_sentiment": (-1, 1),  # -1 to 1 scale
+    "social_sentiment": (-1, 1),
+    "analyst_sentiment": (-1, 1),
+    "overall_sentiment": (-1, 1),
+}
+
+RISK_RANGES = {
+    "beta": (0.5, 2.0),
+    "volatility": (0.15, 0.60),  # 15% to 60% annualized
+    "var_95": (-0.15, -0.05),  # -5% to -15% daily VaR
+    "correlation_spy": (0.3, 0.9),
+    "liquidity_score": (0.3, 1.0),  # 0.3 to 1.0
+    "esg_score": (30, 90),
+}
+
+# Fractional fields that the reports show as percentages; each gets a ``<name>_pct`` companion
+FINANCIAL_PERCENT_FIELDS = ("revenue_growth", "profit_margin", "roe")
+RISK_PERCENT_FIELDS = ("volatility", "var_95")
+
+# Possible values for each categorical field
+FINANCIAL_CHOICES = {
+    "earnings_surprise": ("beat", "miss", "inline"),
+    "analyst_rating": ("Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"),
+}
+
+TECHNICAL_CHOICES = {
+    "macd_signal": ("bullish", "bearish", "neutral"),
+    "bollinger_position": ("upper", "middle", "lower"),
+    "volume_trend": ("increasing", "decreasing", "stable"),
+    "trend": ("bullish", "bearish", "sideways"),
+}
+
+SENTIMENT_CHOICES = {
+    "sentiment_trend": ("improving", "deteriorating", "stable"),
+}
+
+RISK_CHOICES = {
+    "sector_risk": ("low", "medium", "high"),
+    "regulatory_risk": ("low", "medium", "high"),
+}
+
+# Categorical fields that the reports show title-cased; each gets a ``<name>_title`` companion
+TECHNICAL_TITLE_FIELDS = ("macd_signal", "volume_trend", "trend")
+SENTIMENT_TITLE_FIELDS = ("sentiment_trend",)
+RISK_TITLE_FIELDS = ("sector_risk", "regulatory_risk")
+
+# Number of key themes reported per ticker, and how many of those are reported as viral on social media
+THEMES_PER_TICKER = 3
+VIRAL_TOPICS_PER_TICKER = 2
+
+SENTIMENT_THEMES = (
+    "earnings growth",
+    "market expansion",
+    "regulatory concerns",
+    "innovation",
+    "competition",
+    "supply chain",
+    "management changes",
+)
+
+
+def ticker_rng(ticker: str, kind: str) -> np.random.Generator:
+    """
+    Return a random generator seeded from ``ticker`` and the kind of data being generated.
+
+    Seeds use CRC-32 rather than ``hash()``, which is randomized per process.
+
+    Args:
+        ticker: Stock ticker symbol
+        kind: Name of the data set (e.g. "financials"), so each kind gets its own stream
+
+    Returns:
+        A new generator that no other caller shares
+
+    """
+    return np.random.default_rng([zlib.crc32(ticker.encode()), zlib.crc32(kind.encode())])
+
+
+def report_rng(*key: object) -> random.Random:
+    """
+    Return a stdlib random generator seeded from ``key``, for the mock values drawn while rendering a report.
+
+    The key parts are joined into a string, which `random.Random` seeds from via SHA-512, so the
+    same key gives the same draws in every process (unlike seeding with ``hash()``).
+
+    Args:
+        *key: Report name followed by the tool arguments, e.g. ``("ratios", "AAPL", "sector")``
+
+    Returns:
+        A new generator that no other caller shares
+
+    """
+    return random.Random("|".join(map(str, key)))
+
+
+def draw_uniform(rng: np.random.Generator, ranges: dict[str, tuple[float, float]], n: int) -> dict[str, np.ndarray]:
+    """
+    Draw ``n`` values for every field in ``ranges`` with a single RNG call.
+
+    Args:
+        rng: Random generator to draw from
+        ranges: Uniform (low, high) range keyed by field name
+        n: Number of values per field
+
+    Returns:
+        Array of ``n`` values keyed by field name
+
+    """
+    lows, highs = np.array(list(ranges.values())).T
+    values = rng.uniform(lows, highs, size=(n, len(ranges)))
+    return dict(zip(ranges, values.T, strict=True))
+
+
+def draw_choices(rng: np.random.Generator, choices: dict[str, tuple[str, ...]], n: int) -> dict[str, list[str]]:
+    """
+    Pick ``n`` values for every categorical field in ``choices`` with a single RNG call.
+
+    Args:
+        rng: Random generator to draw from
+        choices: Possible values keyed by field name
+        n: Number of values per field
+
+    Returns:
+        List of ``n`` picks keyed by field name
+
+    """
+    indices = rng.integers(0, [len(options) for options in choices.values()], size=(n, len(choices)))
+    return {name: [options[i] for i in column] for (name, options), column in zip(choices.items(), indices.T.tolist(), strict=True)}
+
+
+def add_percent_fields(values: dict[str, np.ndarray], fields: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """Return ``values`` plus a ``<name>_pct`` column (the value times 100) for each of ``fields``."""
+    return {**values, **{f"{name}_pct": values[name] * 100 for name in fields}}
+
+
+def add_title_fields(values: dict[str, list[str]], fields: tuple[str, ...]) -> dict[str, list[str]]:
+    """Return ``values`` plus a title-cased ``<name>_title`` column for each of ``fields``."""
+    return {**values, **{f"{name}_title": [value.title() for value in values[name]] for name in fields}}
+
+
+def to_records(tickers: list[str], columns: dict[str, np.ndarray | list]) -> list[dict]:
+    """Turn per-field columns into one dict per ticker, with plain Python values."""
+    fields = {name: column.tolist() if isinstance(column, np.ndarray) else column for name, column in columns.items()}
+    return [{"ticker": ticker, **{name: values[i] for name, values in fields.items()}} for i, ticker in enumerate(tickers)]
+
+
+def generate_mock_financials_batch(tickers: list[str], rng: np.random.Generator | None = None) -> list[dict]:
+    """
+    Generate mock financial data for several companies at once.
+
+    Args:
+        tickers: Stock ticker symbols
+        rng: Random generator to draw from; defaults to a shared unseeded generator
+
+    Returns:
+        One dictionary of financial metrics per ticker, in the same order
+
+    """
+    n = len(tickers)
+    rng = rng or shared_rng
+    values = add_percent_fields(draw_uniform(rng, FINANCIAL_RANGES, n), FINANCIAL_PERCENT_FIELDS)
+    values["market_cap_b"] = values["market_cap"] / 1e9
+    return to_records(tickers, {**values, **draw_choices(rng, FINANCIAL_CHOICES, n)})
+
+
+def generate_mock_technical_data_batch(tickers: list[str], rng: np.random.Generator | None = None) -> list[dict]:
+    """
+    Generate mock technical analysis data for several tickers at once.
+
+    Args:
+        tickers: Stock ticker symbols
+        rng: Random generator to draw from; defaults to a shared unseeded generator
+
+    Returns:
+        One dictionary of technical indicators and price data per ticker, in the same order
+
+    """
+    n = len(tickers)
+    rng = rng or shared_rng
+    values = draw_uniform(rng, TECHNICAL_RANGES, n)
+    for name in PRICE_RELATIVE_FIELDS:
+        values[name] = values[name] * values["current_price"]
+    return to_records(tickers, {**values, **add_title_fields(draw_choices(rng, TECHNICAL_CHOICES, n), TECHNICAL_TITLE_FIELDS)})
 
 
-def generate_mock_financials(ticker: str) -> dict:
+def generate_mock_sentiment_data_batch(tickers: list[str], rng: np.random.Generator | None = None) -> list[dict]:
+    """
+    Generate mock sentiment analysis data for several tickers at once.
+
+    Args:
+        tickers: Stock ticker symbols
+        rng: Random generator to draw from; defaults to a shared unseeded generator
+
+    Returns:
+        One dictionary of sentiment metrics and trends per ticker, in the same order
+
+    """
+    n = len(tickers)
+    rng = rng or shared_rng
+    # Sample themes without replacement for every ticker at once: ordering each row of random
+    # keys gives an independent random permutation per row
+    theme_indices = rng.random((n, len(SENTIMENT_THEMES))).argsort(axis=1)[:, :THEMES_PER_TICKER]
+    themes = [tuple(SENTIMENT_THEMES[i] for i in row) for row in theme_indices.tolist()]
+    values = draw_uniform(rng, SENTIMENT_RANGES, n)
+    # Split social sentiment into the positive/negative/neutral breakdown the reports show
+    social = values["social_sentiment"]
+    values["social_positive_pct"] = np.maximum(0, social * 50 + 50)
+    values["social_negative_pct"] = np.maximum(0, -social * 50 + 50)
+    values["social_neutral_pct"] = 100 - np.abs(social * 100)
+    return to_records(
+        tickers,
+        {
+            **values,
+            **add_title_fields(draw_choices(rng, SENTIMENT_CHOICES, n), SENTIMENT_TITLE_FIELDS),
+            "key_themes": themes,
+            # Themes are already in random order, so the leading ones are a random sample of them
+            "viral_topics": [row[:VIRAL_TOPICS_PER_TICKER] for row in themes],
+            "news_volume": rng.integers(10, 100, size=n, endpoint=True),
+        },
+    )
+
+
+def generate_mock_risk_data_batch(tickers: list[str], rng: np.random.Generator | None = None) -> list[dict]:
+    """
+    Generate mock risk assessment data for several tickers at once.
+
+    Args:
+        tickers: Stock ticker symbols
+        rng: Random generator to draw from; defaults to a shared unseeded generator
+
+    Returns:
+        One dictionary of risk metrics per ticker, in the same order
+
+    """
+    n = len(tickers)
+    rng = rng or shared_rng
+    values = add_percent_fields(draw_uniform(rng, RISK_RANGES, n), RISK_PERCENT_FIELDS)
+    return to_records(tickers, {**values, **add_title_fields(draw_choices(rng, RISK_CHOICES, n), RISK_TITLE_FIELDS)})
+
+
+@functools.lru_cache(maxsize=1024)
+def generate_mock_financials(ticker: str) -> Mapping[str, Any]:
     """
     Generate mock financial data for a company.
 
@@ -16,26 +303,14 @@ def generate_mock_financials(ticker: str) -> dict:
         ticker: Stock ticker symbol
 
     Returns:
-        Dictionary containing financial metrics
+        Read-only mapping containing financial metrics
 
     """
-    return {
-        "ticker": ticker,
-        "market_cap": random.uniform(50e9, 2e12),  # $50B to $2T
-        "pe_ratio": random.uniform(10, 35),
-        "revenue_growth": random.uniform(-0.1, 0.3),  # -10% to 30%
-        "profit_margin": random.uniform(0.05, 0.25),  # 5% to 25%
-        "debt_to_equity": random.uniform(0.1, 2.0),
-        "roe": random.uniform(0.08, 0.25),  # 8% to 25%
-        "current_ratio": random.uniform(1.0, 3.0),
-        "earnings_surprise": random.choice(["beat", "miss", "inline"]),
-        "analyst_rating": random.choice(
-            ["Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"],
-        ),
-    }
+    return MappingProxyType(generate_mock_financials_batch([ticker], ticker_rng(ticker, "financials"))[0])
 
 
-def generate_mock_technical_data(ticker: str) -> dict:
+@functools.lru_cache(maxsize=1024)
+def generate_mock_technical_data(ticker: str) -> Mapping[str, Any]:
     """
     Generate mock technical analysis data.
 
@@ -43,26 +318,14 @@ def generate_mock_technical_data(ticker: str) -> dict:
         ticker: Stock ticker symbol
 
     Returns:
-        Dictionary containing technical indicators and price data
+        Read-only mapping containing technical indicators and price data
 
     """
-    current_price = random.uniform(50, 500)
-    return {
-        "ticker": ticker,
-        "current_price": current_price,
-        "sma_50": current_price * random.uniform(0.95, 1.05),
-        "sma_200": current_price * random.uniform(0.90, 1.10),
-        "rsi": random.uniform(20, 80),
-        "macd_signal": random.choice(["bullish", "bearish", "neutral"]),
-        "bollinger_position": random.choice(["upper", "middle", "lower"]),
-        "volume_trend": random.choice(["increasing", "decreasing", "stable"]),
-        "support_level": current_price * random.uniform(0.85, 0.95),
-        "resistance_level": current_price * random.uniform(1.05, 1.15),
-        "trend": random.choice(["bullish", "bearish", "sideways"]),
-    }
+    return MappingProxyType(generate_mock_technical_data_batch([ticker], ticker_rng(ticker, "technical"))[0])
 
 
-def generate_mock_sentiment_data(ticker: str) -> dict:
+@functools.lru_cache(maxsize=1024)
+def generate_mock_sentiment_data(ticker: str) -> Mapping[str, Any]:
     """
     Generate mock sentiment analysis data.
 
@@ -70,33 +333,14 @@ def generate_mock_sentiment_data(ticker: str) -> dict:
         ticker: Stock ticker symbol
 
     Returns:
-        Dictionary containing sentiment metrics and trends
-
-    """
-    return {
-        "ticker": ticker,
-        "news_sentiment": random.uniform(-1, 1),  # -1 to 1 scale
-        "social_sentiment": random.uniform(-1, 1),
-        "analyst_sentiment": random.uniform(-1, 1),
-        "overall_sentiment": random.uniform(-1, 1),
-        "sentiment_trend": random.choice(["improving", "deteriorating", "stable"]),
-        "key_themes": random.sample(
-            [
-                "earnings growth",
-                "market expansion",
-                "regulatory concerns",
-                "innovation",
-                "competition",
-                "supply chain",
-                "management changes",
-            ],
-            3,
-        ),
-        "news_volume": random.randint(10, 100),
-    }
-
-
-def generate_mock_risk_data(ticker: str) -> dict:
+        Read-only mapping containing sentiment metrics and trends
+
+    """
+    return MappingProxyType(generate_mock_sentiment_data_batch([ticker], ticker_rng(ticker, "sentiment"))[0])
+
+
+@functools.lru_cache(maxsize=1024)
+def generate_mock_risk_data(ticker: str) -> Mapping[str, Any]:
     """
     Generate mock risk assessment data.
 
@@ -104,17 +348,19 @@ def generate_mock_risk_data(ticker: str) -> dict:
         ticker: Stock ticker symbol
 
     Returns:
-        Dictionary containing risk metrics
-
-    """
-    return {
-        "ticker": ticker,
-        "beta": random.uniform(0.5, 2.0),
-        "volatility": random.uniform(0.15, 0.60),  # 15% to 60% annualized
-        "var_95": random.uniform(-0.05, -0.15),  # -5% to -15% daily VaR
-        "correlation_spy": random.uniform(0.3, 0.9),
-        "liquidity_score": random.uniform(0.3, 1.0),  # 0.3 to 1.0
-        "sector_risk": random.choice(["low", "medium", "high"]),
-        "regulatory_risk": random.choice(["low", "medium", "high"]),
-        "esg_score": random.uniform(30, 90),
-    }
+        Read-only mapping containing risk metrics
+
+    """
+    return MappingProxyType(generate_mock_risk_data_batch([ticker], ticker_rng(ticker, "risk"))[0])
+
+
+def clear_mock_caches() -> None:
+    """Forget all memoized single-ticker results and the reports rendered from them, e.g. between tests."""
+    for generator in (
+        generate_mock_financials,
+        generate_mock_technical_data,
+        generate_mock_sentiment_data,
+        generate_mock_risk_data,
+    ):
+        generator.cache_clear()
+    clear_render_caches()
@@ -5,13 +5,14 @@ This module provides tools for fundamental analysis of stocks, including
 financial statements analysis, valuation metrics, and industry comparisons.
 """
 
-import random
+from collections.abc import Mapping
 from typing import Any
 
 from strands import tool
 from strands.types.tools import ToolResult, ToolUse
 
-from tools.data_generators import generate_mock_financials
+from tools.data_generators import generate_mock_financials, report_rng
+from tools.results import cached_render, success_result
 
 # Tool specs
 TOOL_SPEC_GET_COMPANY_FINANCIALS = {
@@ -54,90 +55,116 @@ TOOL_SPEC_CALCULATE_RATIOS = {
 }
 
 
-# Tool implementations
-def get_company_financials(tool: ToolUse, **kwargs: Any) -> ToolResult:
+# Report templates, filled from the view builders below
+FINANCIAL_ANALYSIS_TEMPLATE = """
+    Financial Analysis for {ticker}:
+
+    Valuation Metrics:
+    - Market Cap: ${market_cap_b:.1f}B
+    - P/E Ratio: {pe_ratio:.1f}
+    - Current Analyst Rating: {analyst_rating}
+
+    Growth & Profitability:
+    - Revenue Growth: {revenue_growth_pct:+.1f}%
+    - Profit Margin: {profit_margin_pct:.1f}%
+    - ROE: {roe_pct:.1f}%
+
+    Financial Health:
+    - Debt-to-Equity: {debt_to_equity:.2f}
+    - Current Ratio: {current_ratio:.2f}
+    - Recent Earnings: {earnings_surprise}
     """
-    Retrieve comprehensive financial data for a company.
 
-    Args:
-        tool: Tool use information
+RATIO_ANALYSIS_TEMPLATE = """
+    Ratio Analysis for {ticker} vs {comparison_type} average:
 
-    Returns:
-        Tool result with formatted financial analysis
+    Valuation Comparison:
+    - P/E Ratio: {pe_ratio:.1f} (Sector: {sector_pe:.1f})
+    - Relative Valuation: {relative_valuation}
+
+    Profitability Comparison:
+    - ROE: {roe_pct:.1f}% (Sector: {sector_roe_pct:.1f}%)
+    - Profit Margin: {profit_margin_pct:.1f}% (Sector: {sector_margin_pct:.1f}%)
 
+    Performance vs Peers: {peer_performance}
     """
-    tool_use_id = tool["toolUseId"]
-    ticker = tool["input"]["ticker"]
 
-    data = generate_mock_financials(ticker)
 
-    analysis = f"""
-    Financial Analysis for {ticker}:
+def financials_view(ticker: str) -> Mapping[str, Any]:
+    """Return the cached financials record, which carries every field the financial analysis report shows."""
+    return generate_mock_financials(ticker)
 
-    Valuation Metrics:
-    - Market Cap: ${data["market_cap"] / 1e9:.1f}B
-    - P/E Ratio: {data["pe_ratio"]:.1f}
-    - Current Analyst Rating: {data["analyst_rating"]}
 
-    Growth & Profitability:
-    - Revenue Growth: {data["revenue_growth"] * 100:+.1f}%
-    - Profit Margin: {data["profit_margin"] * 100:.1f}%
-    - ROE: {data["roe"] * 100:.1f}%
+@cached_render
+def render_financials(ticker: str) -> str:
+    """Render the financial analysis report returned by both financial analysis tools."""
+    return FINANCIAL_ANALYSIS_TEMPLATE.format_map(financials_view(ticker))
 
-    Financial Health:
-    - Debt-to-Equity: {data["debt_to_equity"]:.2f}
-    - Current Ratio: {data["current_ratio"]:.2f}
-    - Recent Earnings: {data["earnings_surprise"]}
-    """
+
+def ratios_view(ticker: str, comparison_type: str) -> dict[str, Any]:
+    """Compare the company's P/E, ROE, and profit margin with mock sector averages for ``comparison_type``."""
+    data = generate_mock_financials(ticker)
+
+    # Mock sector averages
+    rng = report_rng("ratios", ticker, comparison_type)
+    sector_pe = rng.uniform(15, 25)
+    sector_roe = rng.uniform(0.10, 0.20)
+    sector_margin = rng.uniform(0.08, 0.18)
 
     return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
+        "ticker": ticker,
+        "comparison_type": comparison_type,
+        "pe_ratio": data["pe_ratio"],
+        "sector_pe": sector_pe,
+        "relative_valuation": "Premium" if data["pe_ratio"] > sector_pe else "Discount",
+        "roe_pct": data["roe_pct"],
+        "sector_roe_pct": sector_roe * 100,
+        "profit_margin_pct": data["profit_margin_pct"],
+        "sector_margin_pct": sector_margin * 100,
+        "peer_performance": "Outperforming" if data["roe"] > sector_roe else "Underperforming",
     }
 
 
-def calculate_ratios(tool: ToolUse, **kwargs: Any) -> ToolResult:
+@cached_render
+def render_ratios(ticker: str, comparison_type: str) -> str:
+    """Render the ratio analysis report returned by both ratio analysis tools."""
+    return RATIO_ANALYSIS_TEMPLATE.format_map(ratios_view(ticker, comparison_type))
+
+
+# Tool implementations
+def get_company_financials(tool: ToolUse, **kwargs: Any) -> ToolResult:
     """
-    Calculate and compare financial ratios against sector or market benchmarks.
+    Retrieve comprehensive financial data for a company.
 
     Args:
         tool: Tool use information
 
     Returns:
-        Tool result with ratio analysis
+        Tool result with formatted financial analysis
 
     """
     tool_use_id = tool["toolUseId"]
     ticker = tool["input"]["ticker"]
-    comparison_type = tool["input"].get("comparison_type", "sector")
 
-    data = generate_mock_financials(ticker)
+    return success_result(tool_use_id, render_financials(ticker))
 
-    # Mock sector averages
-    sector_pe = random.uniform(15, 25)
-    sector_roe = random.uniform(0.10, 0.20)
-    sector_margin = random.uniform(0.08, 0.18)
 
-    analysis = f"""
-    Ratio Analysis for {ticker} vs {comparison_type} average:
+def calculate_ratios(tool: ToolUse, **kwargs: Any) -> ToolResult:
+    """
+    Calculate and compare financial ratios against sector or market benchmarks.
 
-    Valuation Comparison:
-    - P/E Ratio: {data["pe_ratio"]:.1f} (Sector: {sector_pe:.1f})
-    - Relative Valuation: {"Premium" if data["pe_ratio"] > sector_pe else "Discount"}
+    Args:
+        tool: Tool use information
 
-    Profitability Comparison:
-    - ROE: {data["roe"] * 100:.1f}% (Sector: {sector_roe * 100:.1f}%)
-    - Profit Margin: {data["profit_margin"] * 100:.1f}% (Sector: {sector_margin * 100:.1f}%)
+    Returns:
+        Tool result with ratio analysis
 
-    Performance vs Peers: {"Outperforming" if data["roe"] > sector_roe else "Underperforming"}
     """
+    tool_use_id = tool["toolUseId"]
+    ticker = tool["input"]["ticker"]
+    comparison_type = tool["input"].get("comparison_type", "sector")
 
-    return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
-    }
+    return success_result(tool_use_id, render_ratios(ticker, comparison_type))
 
 
 # Function-style tools for backward compatibility and direct testing
@@ -157,28 +184,7 @@ def get_company_financials_func(ticker: str) -> str:
         Formatted string with financial analysis for the company
 
     """  # noqa: D205
-    data = generate_mock_financials(ticker)
-
-    analysis = f"""
-    Financial Analysis for {ticker}:
-
-    Valuation Metrics:
-    - Market Cap: ${data["market_cap"] / 1e9:.1f}B
-    - P/E Ratio: {data["pe_ratio"]:.1f}
-    - Current Analyst Rating: {data["analyst_rating"]}
-
-    Growth & Profitability:
-    - Revenue Growth: {data["revenue_growth"] * 100:+.1f}%
-    - Profit Margin: {data["profit_margin"] * 100:.1f}%
-    - ROE: {data["roe"] * 100:.1f}%
-
-    Financial Health:
-    - Debt-to-Equity: {data["debt_to_equity"]:.2f}
-    - Current Ratio: {data["current_ratio"]:.2f}
-    - Recent Earnings: {data["earnings_surprise"]}
-    """
-
-    return analysis
+    return render_financials(ticker)
 
 
 @tool
@@ -198,25 +204,4 @@ def calculate_ratios_func(ticker: str, comparison_type: str = "sector") -> str:
         Formatted string with ratio analysis comparing the company to benchmarks
 
     """
-    data = generate_mock_financials(ticker)
-
-    # Mock sector averages
-    sector_pe = random.uniform(15, 25)
-    sector_roe = random.uniform(0.10, 0.20)
-    sector_margin = random.uniform(0.08, 0.18)
-
-    analysis = f"""
-    Ratio Analysis for {ticker} vs {comparison_type} average:
-
-    Valuation Comparison:
-    - P/E Ratio: {data["pe_ratio"]:.1f} (Sector: {sector_pe:.1f})
-    - Relative Valuation: {"Premium" if data["pe_ratio"] > sector_pe else "Discount"}
-
-    Profitability Comparison:
-    - ROE: {data["roe"] * 100:.1f}% (Sector: {sector_roe * 100:.1f}%)
-    - Profit Margin: {data["profit_margin"] * 100:.1f}% (Sector: {sector_margin * 100:.1f}%)
-
-    Performance vs Peers: {"Outperforming" if data["roe"] > sector_roe else "Underperforming"}
-    """
-
-    return analysis
+    return render_ratios(ticker, comparison_type)
@@ -0,0 +1,60 @@
+"""
+Helpers shared by the tool modules for producing their results.
+
+The ``render_*`` report functions are memoized with `cached_render`: the mock data and the
+extra values drawn while rendering are both seeded from the tool arguments, so the same
+arguments always produce the same text. Set ``STRANDS_DISABLE_RENDER_CACHE=1`` to render on
+every call, e.g. once the generators are backed by live data.
+"""
+
+import functools
+import os
+from collections.abc import Callable
+
+from strands.types.tools import ToolResult
+
+RENDER_CACHE_SIZE = 1024
+
+render_cache_enabled = os.environ.get("STRANDS_DISABLE_RENDER_CACHE", "0") == "0"
+
+# Every memoized render function, so they can be cleared together
+cached_renders: list[Callable[..., str]] = []
+
+
+def cached_render(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize a report render function on its arguments, unless render caching is disabled.
+
+    Args:
+        func: Render function whose arguments are hashable
+
+    Returns:
+        The memoized function, or ``func`` itself when ``STRANDS_DISABLE_RENDER_CACHE`` is set
+
+    """
+    if not render_cache_enabled:
+        return func
+    cached = functools.lru_cache(maxsize=RENDER_CACHE_SIZE)(func)
+    cached_renders.append(cached)
+    return cached
+
+
+def clear_render_caches() -> None:
+    """Forget all memoized reports."""
+    for render in cached_renders:
+        render.cache_clear()
+
+
+def success_result(tool_use_id: str, text: str) -> ToolResult:
+    """
+    Wrap a text report in a successful tool result.
+
+    Args:
+        tool_use_id: ID of the tool use being answered
+        text: Report to return to the model
+
+    Returns:
+        Tool result with ``text`` as its only content block
+
+    """
+    return {"toolUseId": tool_use_id, "status": "success", "content": [{"text": text}]}
@@ -5,18 +5,25 @@ This module provides tools for risk assessment of stocks, including
 market risk metrics, volatility analysis, and portfolio impact evaluation.
 """
 
-import random
+import bisect
+from collections import ChainMap
+from collections.abc import Mapping
 from typing import Any
 
 from strands import tool
 from strands.types.tools import ToolResult, ToolUse
 
-from tools.data_generators import generate_mock_risk_data
+from tools.data_generators import generate_mock_risk_data, report_rng
+from tools.results import cached_render, success_result
 
 # Constants
 BETA_HIGH = 1.5
 BETA_MEDIUM = 0.8
 
+# Beta tiers: a beta above BETA_LEVEL_EDGES[i] moves up to BETA_LEVELS[i + 1]
+BETA_LEVEL_EDGES = (BETA_MEDIUM, BETA_HIGH)
+BETA_LEVELS = ("Low", "Medium", "High")
+
 # Tool specs
 TOOL_SPEC_CALCULATE_RISK_METRICS = {
     "name": "calculate_risk_metrics",
@@ -58,90 +65,115 @@ TOOL_SPEC_PORTFOLIO_IMPACT_ANALYSIS = {
 }
 
 
-# Tool implementations
-def calculate_risk_metrics(tool: ToolUse, **kwargs: Any) -> ToolResult:
+# Report templates, filled from the view builders below
+RISK_ASSESSMENT_TEMPLATE = """
+    Risk Assessment for {ticker}:
+
+    Market Risk:
+    - Beta: {beta:.2f} ({beta_level} market risk)
+    - Volatility: {volatility_pct:.1f}% (annualized)
+    - 95% VaR: {var_95_pct:.1f}% (daily)
+
+    Correlation & Liquidity:
+    - S&P 500 Correlation: {correlation_spy:.2f}
+    - Liquidity Score: {liquidity_score:.2f}/1.0
+
+    Other Risk Factors:
+    - Sector Risk: {sector_risk_title}
+    - Regulatory Risk: {regulatory_risk_title}
+    - ESG Score: {esg_score:.0f}/100
     """
-    Calculate comprehensive risk metrics for the security.
 
-    Args:
-        tool: Tool use information
-        **kwargs: Additional arguments
+PORTFOLIO_IMPACT_TEMPLATE = """
+    Portfolio Impact Analysis for {ticker} (Position Size: {position_size_pct:.1f}%):
 
-    Returns:
-        Tool result with risk assessment metrics
+    Risk Contribution:
+    - Beta Impact on Portfolio: +{portfolio_beta_impact:.3f}
+    - Volatility Contribution: {volatility_contribution_pct:.2f}%
+    - Diversification Benefit: {diversification_benefit:.1%}
 
+    Recommendations:
+    - Maximum Position Size: {max_position_pct:.1f}%
+    - Risk-Adjusted Position: {risk_adjusted_position_pct:.1f}%
+    - Hedging Requirement: {hedging_required}
     """
-    tool_use_id = tool["toolUseId"]
-    ticker = tool["input"]["ticker"]
 
+
+def risk_metrics_view(ticker: str) -> Mapping[str, Any]:
+    """Add the Low/Medium/High beta label to the cached risk record, without copying the record."""
     data = generate_mock_risk_data(ticker)
+    return ChainMap({"beta_level": BETA_LEVELS[bisect.bisect_left(BETA_LEVEL_EDGES, data["beta"])]}, data)
 
-    analysis = f"""
-    Risk Assessment for {ticker}:
 
-    Market Risk:
-    - Beta: {data["beta"]:.2f} ({"High" if data["beta"] > BETA_HIGH else "Medium" if data["beta"] > BETA_MEDIUM else "Low"} market risk)
-    - Volatility: {data["volatility"] * 100:.1f}% (annualized)
-    - 95% VaR: {data["var_95"] * 100:.1f}% (daily)
+@cached_render
+def render_risk_metrics(ticker: str) -> str:
+    """Render the risk assessment report returned by both risk assessment tools."""
+    return RISK_ASSESSMENT_TEMPLATE.format_map(risk_metrics_view(ticker))
 
-    Correlation & Liquidity:
-    - S&P 500 Correlation: {data["correlation_spy"]:.2f}
-    - Liquidity Score: {data["liquidity_score"]:.2f}/1.0
 
-    Other Risk Factors:
-    - Sector Risk: {data["sector_risk"].title()}
-    - Regulatory Risk: {data["regulatory_risk"].title()}
-    - ESG Score: {data["esg_score"]:.0f}/100
-    """
+def portfolio_impact_view(ticker: str, position_size: float) -> dict[str, Any]:
+    """Estimate the beta, volatility, and sizing effects of a ``position_size`` allocation to ``ticker``."""
+    data = generate_mock_risk_data(ticker)
+
+    # Mock portfolio impact calculations
+    rng = report_rng("portfolio_impact", ticker, position_size)
+    portfolio_beta_impact = data["beta"] * position_size
+    diversification_benefit = rng.uniform(0.7, 0.95)
 
     return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
+        "ticker": ticker,
+        "position_size_pct": position_size * 100,
+        "portfolio_beta_impact": portfolio_beta_impact,
+        "volatility_contribution_pct": data["volatility_pct"] * position_size,
+        "diversification_benefit": diversification_benefit,
+        "max_position_pct": min(0.10, 1 / data["beta"] * 0.05) * 100,
+        "risk_adjusted_position_pct": position_size * diversification_benefit * 100,
+        "hedging_required": "Yes" if data["beta"] > BETA_HIGH else "No",
     }
 
 
-def portfolio_impact_analysis(tool: ToolUse, **kwargs: Any) -> ToolResult:
+@cached_render
+def render_portfolio_impact(ticker: str, position_size: float) -> str:
+    """Render the portfolio impact report returned by both portfolio impact tools."""
+    return PORTFOLIO_IMPACT_TEMPLATE.format_map(portfolio_impact_view(ticker, position_size))
+
+
+# Tool implementations
+def calculate_risk_metrics(tool: ToolUse, **kwargs: Any) -> ToolResult:
     """
-    Analyze the impact of adding this position to a diversified portfolio.
+    Calculate comprehensive risk metrics for the security.
 
     Args:
         tool: Tool use information
         **kwargs: Additional arguments
 
     Returns:
-        Tool result with portfolio impact analysis
+        Tool result with risk assessment metrics
 
     """
     tool_use_id = tool["toolUseId"]
     ticker = tool["input"]["ticker"]
-    position_size = tool["input"].get("position_size", 0.05)
 
-    data = generate_mock_risk_data(ticker)
+    return success_result(tool_use_id, render_risk_metrics(ticker))
 
-    # Mock portfolio impact calculations
-    portfolio_beta_impact = data["beta"] * position_size
-    diversification_benefit = random.uniform(0.7, 0.95)
 
-    analysis = f"""
-    Portfolio Impact Analysis for {ticker} (Position Size: {position_size * 100:.1f}%):
+def portfolio_impact_analysis(tool: ToolUse, **kwargs: Any) -> ToolResult:
+    """
+    Analyze the impact of adding this position to a diversified portfolio.
 
-    Risk Contribution:
-    - Beta Impact on Portfolio: +{portfolio_beta_impact:.3f}
-    - Volatility Contribution: {data["volatility"] * position_size * 100:.2f}%
-    - Diversification Benefit: {diversification_benefit:.1%}
+    Args:
+        tool: Tool use information
+        **kwargs: Additional arguments
+
+    Returns:
+        Tool result with portfolio impact analysis
 
-    Recommendations:
-    - Maximum Position Size: {min(0.10, 1 / data["beta"] * 0.05) * 100:.1f}%
-    - Risk-Adjusted Position: {position_size * diversification_benefit * 100:.1f}%
-    - Hedging Requirement: {"Yes" if data["beta"] > BETA_HIGH else "No"}
     """
+    tool_use_id = tool["toolUseId"]
+    ticker = tool["input"]["ticker"]
+    position_size = tool["input"].get("position_size", 0.05)
 
-    return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
-    }
+    return success_result(tool_use_id, render_portfolio_impact(ticker, position_size))
 
 
 # Function-style tools for backward compatibility and direct testing
@@ -160,27 +192,7 @@ def calculate_risk_metrics_func(ticker: str) -> str:
         Formatted string with risk assessment metrics
 
     """
-    data = generate_mock_risk_data(ticker)
-
-    analysis = f"""
-    Risk Assessment for {ticker}:
-
-    Market Risk:
-    - Beta: {data["beta"]:.2f} ({"High" if data["beta"] > BETA_HIGH else "Medium" if data["beta"] > BETA_MEDIUM else "Low"} market risk)
-    - Volatility: {data["volatility"] * 100:.1f}% (annualized)
-    - 95% VaR: {data["var_95"] * 100:.1f}% (daily)
-
-    Correlation & Liquidity:
-    - S&P 500 Correlation: {data["correlation_spy"]:.2f}
-    - Liquidity Score: {data["liquidity_score"]:.2f}/1.0
-
-    Other Risk Factors:
-    - Sector Risk: {data["sector_risk"].title()}
-    - Regulatory Risk: {data["regulatory_risk"].title()}
-    - ESG Score: {data["esg_score"]:.0f}/100
-    """
-
-    return analysis
+    return render_risk_metrics(ticker)
 
 
 @tool
@@ -199,24 +211,4 @@ def portfolio_impact_analysis_func(ticker: str, position_size: float = 0.05) ->
         Formatted string with portfolio impact analysis
 
     """
-    data = generate_mock_risk_data(ticker)
-
-    # Mock portfolio impact calculations
-    portfolio_beta_impact = data["beta"] * position_size
-    diversification_benefit = random.uniform(0.7, 0.95)
-
-    analysis = f"""
-    Portfolio Impact Analysis for {ticker} (Position Size: {position_size * 100:.1f}%):
-
-    Risk Contribution:
-    - Beta Impact on Portfolio: +{portfolio_beta_impact:.3f}
-    - Volatility Contribution: {data["volatility"] * position_size * 100:.2f}%
-    - Diversification Benefit: {diversification_benefit:.1%}
-
-    Recommendations:
-    - Maximum Position Size: {min(0.10, 1 / data["beta"] * 0.05) * 100:.1f}%
-    - Risk-Adjusted Position: {position_size * diversification_benefit * 100:.1f}%
-    - Hedging Requirement: {"Yes" if data["beta"] > BETA_HIGH else "No"}
-    """
-
-    return analysis
+    return render_portfolio_impact(ticker, position_size)
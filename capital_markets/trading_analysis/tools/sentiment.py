@@ -5,13 +5,15 @@ This module provides tools for sentiment analysis of stocks, including
 news sentiment analysis, social media trends, and market narrative analysis.
 """
 
-import random
+from collections import ChainMap
+from collections.abc import Mapping
 from typing import Any
 
 from strands import tool
 from strands.types.tools import ToolResult, ToolUse
 
-from tools.data_generators import generate_mock_sentiment_data
+from tools.data_generators import generate_mock_sentiment_data, report_rng
+from tools.results import cached_render, success_result
 
 # Tool specs
 TOOL_SPEC_ANALYZE_NEWS_SENTIMENT = {
@@ -54,89 +56,114 @@ TOOL_SPEC_SOCIAL_MEDIA_TRENDS = {
 }
 
 
-# Tool implementations
-def analyze_news_sentiment(tool: ToolUse, **kwargs: Any) -> ToolResult:
+# Report templates, filled from the view builders below
+NEWS_SENTIMENT_TEMPLATE = """
+    News Sentiment Analysis for {ticker} (Last {days} days):
+
+    Sentiment Scores:
+    - News Sentiment: {news_sentiment:.2f} (-1 to +1 scale)
+    - Social Media: {social_sentiment:.2f}
+    - Analyst Sentiment: {analyst_sentiment:.2f}
+    - Overall Sentiment: {overall_sentiment:.2f}
+
+    Sentiment Trend: {sentiment_trend_title}
+    News Volume: {news_volume} articles
+
+    Key Themes: {key_themes_text}
     """
-    Analyze sentiment from recent news articles and press releases.
 
-    Args:
-        tool: Tool use information
-        **kwargs: Additional arguments
+SOCIAL_MEDIA_TEMPLATE = """
+    Social Media Analysis for {ticker}:
 
-    Returns:
-        Tool result with news sentiment analysis
+    Activity Metrics:
+    - Total Mentions: {mentions}
+    - Engagement Rate: {engagement_pct:.1f}%
+    - Sentiment Trend: {sentiment_trend_title}
+
+    Sentiment Breakdown:
+    - Positive: {social_positive_pct:.0f}%
+    - Negative: {social_negative_pct:.0f}%
+    - Neutral: {social_neutral_pct:.0f}%
 
+    Viral Topics: {viral_topics}
     """
-    tool_use_id = tool["toolUseId"]
-    ticker = tool["input"]["ticker"]
-    days = tool["input"].get("days", 7)
 
+
+def news_sentiment_view(ticker: str, days: int) -> Mapping[str, Any]:
+    """Add the look-back window and the joined key themes to the cached sentiment record, without copying the record."""
     data = generate_mock_sentiment_data(ticker)
+    return ChainMap({"days": days, "key_themes_text": ", ".join(data["key_themes"])}, data)
 
-    analysis = f"""
-    News Sentiment Analysis for {ticker} (Last {days} days):
 
-    Sentiment Scores:
-    - News Sentiment: {data["news_sentiment"]:.2f} (-1 to +1 scale)
-    - Social Media: {data["social_sentiment"]:.2f}
-    - Analyst Sentiment: {data["analyst_sentiment"]:.2f}
-    - Overall Sentiment: {data["overall_sentiment"]:.2f}
+@cached_render
+def render_news_sentiment(ticker: str, days: int) -> str:
+    """Render the news sentiment report returned by both news sentiment tools."""
+    return NEWS_SENTIMENT_TEMPLATE.format_map(news_sentiment_view(ticker, days))
 
-    Sentiment Trend: {data["sentiment_trend"].title()}
-    News Volume: {data["news_volume"]} articles
 
-    Key Themes: {", ".join(data["key_themes"])}
-    """
+def social_media_view(ticker: str) -> dict[str, Any]:
+    """Combine mock mention and engagement counts with the social sentiment split from the cached record."""
+    data = generate_mock_sentiment_data(ticker)
+
+    # Generate mock social media metrics
+    rng = report_rng("social_media", ticker)
+    mentions = rng.randint(100, 5000)
+    engagement = rng.uniform(0.02, 0.15)
 
     return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
+        "ticker": ticker,
+        "mentions": mentions,
+        "engagement_pct": engagement * 100,
+        "sentiment_trend_title": data["sentiment_trend_title"],
+        "social_positive_pct": data["social_positive_pct"],
+        "social_negative_pct": data["social_negative_pct"],
+        "social_neutral_pct": data["social_neutral_pct"],
+        "viral_topics": ", ".join(data["viral_topics"]),
     }
 
 
-def social_media_trends(tool: ToolUse, **kwargs: Any) -> ToolResult:
+@cached_render
+def render_social_media(ticker: str) -> str:
+    """Render the social media report returned by both social media tools."""
+    return SOCIAL_MEDIA_TEMPLATE.format_map(social_media_view(ticker))
+
+
+# Tool implementations
+def analyze_news_sentiment(tool: ToolUse, **kwargs: Any) -> ToolResult:
     """
-    Analyze social media mentions and sentiment trends.
+    Analyze sentiment from recent news articles and press releases.
 
     Args:
         tool: Tool use information
         **kwargs: Additional arguments
 
     Returns:
-        Tool result with social media analysis
+        Tool result with news sentiment analysis
 
     """
     tool_use_id = tool["toolUseId"]
     ticker = tool["input"]["ticker"]
+    days = tool["input"].get("days", 7)
 
-    data = generate_mock_sentiment_data(ticker)
+    return success_result(tool_use_id, render_news_sentiment(ticker, days))
 
-    # Generate mock social media metrics
-    mentions = random.randint(100, 5000)
-    engagement = random.uniform(0.02, 0.15)
 
-    analysis = f"""
-    Social Media Analysis for {ticker}:
+def social_media_trends(tool: ToolUse, **kwargs: Any) -> ToolResult:
+    """
+    Analyze social media mentions and sentiment trends.
 
-    Activity Metrics:
-    - Total Mentions: {mentions}
-    - Engagement Rate: {engagement * 100:.1f}%
-    - Sentiment Trend: {data["sentiment_trend"].title()}
+    Args:
+        tool: Tool use information
+        **kwargs: Additional arguments
 
-    Sentiment Breakdown:
-    - Positive: {max(0, data["social_sentiment"] * 50 + 50):.0f}%
-    - Negative: {max(0, -data["social_sentiment"] * 50 + 50):.0f}%
-    - Neutral: {100 - abs(data["social_sentiment"] * 100):.0f}%
+    Returns:
+        Tool result with social media analysis
 
-    Viral Topics: {", ".join(random.sample(data["key_themes"], 2))}
     """
+    tool_use_id = tool["toolUseId"]
+    ticker = tool["input"]["ticker"]
 
-    return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
-    }
+    return success_result(tool_use_id, render_social_media(ticker))
 
 
 # Function-style tools for backward compatibility and direct testing
@@ -156,24 +183,7 @@ def analyze_news_sentiment_func(ticker: str, days: int = 7) -> str:
         Formatted string with news sentiment analysis
 
     """
-    data = generate_mock_sentiment_data(ticker)
-
-    analysis = f"""
-    News Sentiment Analysis for {ticker} (Last {days} days):
-
-    Sentiment Scores:
-    - News Sentiment: {data["news_sentiment"]:.2f} (-1 to +1 scale)
-    - Social Media: {data["social_sentiment"]:.2f}
-    - Analyst Sentiment: {data["analyst_sentiment"]:.2f}
-    - Overall Sentiment: {data["overall_sentiment"]:.2f}
-
-    Sentiment Trend: {data["sentiment_trend"].title()}
-    News Volume: {data["news_volume"]} articles
-
-    Key Themes: {", ".join(data["key_themes"])}
-    """
-
-    return analysis
+    return render_news_sentiment(ticker, days)
 
 
 @tool
@@ -191,26 +201,4 @@ def social_media_trends_func(ticker: str) -> str:
         Formatted string with social media analysis
 
     """
-    data = generate_mock_sentiment_data(ticker)
-
-    # Generate mock social media metrics
-    mentions = random.randint(100, 5000)
-    engagement = random.uniform(0.02, 0.15)
-
-    analysis = f"""
-    Social Media Analysis for {ticker}:
-
-    Activity Metrics:
-    - Total Mentions: {mentions}
-    - Engagement Rate: {engagement * 100:.1f}%
-    - Sentiment Trend: {data["sentiment_trend"].title()}
-
-    Sentiment Breakdown:
-    - Positive: {max(0, data["social_sentiment"] * 50 + 50):.0f}%
-    - Negative: {max(0, -data["social_sentiment"] * 50 + 50):.0f}%
-    - Neutral: {100 - abs(data["social_sentiment"] * 100):.0f}%
-
-    Viral Topics: {", ".join(random.sample(data["key_themes"], 2))}
-    """
-
-    return analysis
+    return render_social_media(ticker)
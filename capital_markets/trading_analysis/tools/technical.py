@@ -5,12 +5,15 @@ This module provides tools for technical analysis of stocks, including
 price chart analysis, pattern recognition, and technical indicators.
 """
 
-import random
+import bisect
+import math
+from collections.abc import Mapping
 from typing import Any
 
 from strands import tool
 from strands.types.tools import ToolResult, ToolUse
-from tools.data_generators import generate_mock_technical_data
+from tools.data_generators import generate_mock_technical_data, report_rng
+from tools.results import cached_render, success_result
 
 # Tool specs
 TOOL_SPEC_GET_PRICE_HISTORY = {
@@ -48,6 +51,97 @@ TOOL_SPEC_IDENTIFY_PATTERNS = {
 }
 
 
+# Indicator thresholds
+RSI_OVERBOUGHT = 70
+RSI_OVERSOLD = 30
+
+# RSI tiers: an RSI above RSI_SIGNAL_EDGES[i] moves up to RSI_SIGNALS[i + 1]. The lower edge sits
+# just below RSI_OVERSOLD so that a reading of exactly RSI_OVERSOLD is still neutral
+RSI_SIGNAL_EDGES = (math.nextafter(RSI_OVERSOLD, -math.inf), RSI_OVERBOUGHT)
+RSI_SIGNALS = ("Oversold", "Neutral", "Overbought")
+
+# Mock pattern recognition outcomes, already in display form
+CHART_PATTERNS = (
+    "Ascending Triangle",
+    "Head And Shoulders",
+    "Double Bottom",
+    "Bull Flag",
+    "Wedge",
+    "Channel Breakout",
+)
+PATTERN_RELIABILITY = ("High", "Medium", "Low")
+SUGGESTED_ACTIONS = ("Buy", "Sell", "Hold", "Wait for breakout")
+
+# Report templates, filled from the view builders below
+PRICE_HISTORY_TEMPLATE = """
+    Technical Analysis for {ticker}:
+
+    Price Action:
+    - Current Price: ${current_price:.2f}
+    - 50-day SMA: ${sma_50:.2f}
+    - 200-day SMA: ${sma_200:.2f}
+    - Overall Trend: {trend_title}
+
+    Key Levels:
+    - Support: ${support_level:.2f}
+    - Resistance: ${resistance_level:.2f}
+
+    Volume Analysis:
+    - Volume Trend: {volume_trend_title}
+    """
+
+PATTERN_ANALYSIS_TEMPLATE = """
+    Pattern Analysis for {ticker}:
+
+    Technical Indicators:
+    - RSI: {rsi:.1f} ({rsi_signal})
+    - MACD Signal: {macd_signal_title}
+    - Bollinger Bands: Price at {bollinger_position} band
+
+    Pattern Recognition:
+    - Detected Pattern: {detected_pattern}
+    - Pattern Reliability: {pattern_reliability}
+    - Suggested Action: {suggested_action}
+    """
+
+
+def price_history_view(ticker: str) -> Mapping[str, Any]:
+    """Return the cached technical record, which carries every field the price history report shows."""
+    return generate_mock_technical_data(ticker)
+
+
+@cached_render
+def render_price_history(ticker: str) -> str:
+    """Render the price history report returned by both price history tools."""
+    return PRICE_HISTORY_TEMPLATE.format_map(price_history_view(ticker))
+
+
+def patterns_view(ticker: str) -> dict[str, Any]:
+    """Classify the RSI and pick a mock chart pattern, its reliability, and a suggested action."""
+    data = generate_mock_technical_data(ticker)
+
+    # Generate mock pattern analysis
+    rng = report_rng("patterns", ticker)
+    detected_pattern = rng.choice(CHART_PATTERNS)
+
+    return {
+        "ticker": ticker,
+        "rsi": data["rsi"],
+        "rsi_signal": RSI_SIGNALS[bisect.bisect_left(RSI_SIGNAL_EDGES, data["rsi"])],
+        "macd_signal_title": data["macd_signal_title"],
+        "bollinger_position": data["bollinger_position"],
+        "detected_pattern": detected_pattern,
+        "pattern_reliability": rng.choice(PATTERN_RELIABILITY),
+        "suggested_action": rng.choice(SUGGESTED_ACTIONS),
+    }
+
+
+@cached_render
+def render_patterns(ticker: str) -> str:
+    """Render the pattern analysis report returned by both pattern analysis tools."""
+    return PATTERN_ANALYSIS_TEMPLATE.format_map(patterns_view(ticker))
+
+
 # Tool implementations
 def get_price_history(tool: ToolUse, **kwargs: Any) -> ToolResult:
     """
@@ -64,30 +158,7 @@ def get_price_history(tool: ToolUse, **kwargs: Any) -> ToolResult:
     tool_use_id = tool["toolUseId"]
     ticker = tool["input"]["ticker"]
 
-    data = generate_mock_technical_data(ticker)
-
-    analysis = f"""
-    Technical Analysis for {ticker}:
-
-    Price Action:
-    - Current Price: ${data["current_price"]:.2f}
-    - 50-day SMA: ${data["sma_50"]:.2f}
-    - 200-day SMA: ${data["sma_200"]:.2f}
-    - Overall Trend: {data["trend"].title()}
-
-    Key Levels:
-    - Support: ${data["support_level"]:.2f}
-    - Resistance: ${data["resistance_level"]:.2f}
-
-    Volume Analysis:
-    - Volume Trend: {data["volume_trend"].title()}
-    """
-
-    return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
-    }
+    return success_result(tool_use_id, render_price_history(ticker))
 
 
 def identify_patterns(tool: ToolUse, **kwargs: Any) -> ToolResult:
@@ -105,38 +176,7 @@ def identify_patterns(tool: ToolUse, **kwargs: Any) -> ToolResult:
     tool_use_id = tool["toolUseId"]
     ticker = tool["input"]["ticker"]
 
-    data = generate_mock_technical_data(ticker)
-
-    # Generate mock pattern analysis
-    patterns = [
-        "ascending triangle",
-        "head and shoulders",
-        "double bottom",
-        "bull flag",
-        "wedge",
-        "channel breakout",
-    ]
-    detected_pattern = random.choice(patterns)
-
-    analysis = f"""
-    Pattern Analysis for {ticker}:
-
-    Technical Indicators:
-    - RSI: {data["rsi"]:.1f} ({"Overbought" if data["rsi"] > 70 else "Oversold" if data["rsi"] < 30 else "Neutral"})
-    - MACD Signal: {data["macd_signal"].title()}
-    - Bollinger Bands: Price at {data["bollinger_position"]} band
-
-    Pattern Recognition:
-    - Detected Pattern: {detected_pattern.title()}
-    - Pattern Reliability: {random.choice(["High", "Medium", "Low"])}
-    - Suggested Action: {random.choice(["Buy", "Sell", "Hold", "Wait for breakout"])}
-    """
-
-    return {
-        "toolUseId": tool_use_id,
-        "status": "success",
-        "content": [{"text": analysis}],
-    }
+    return success_result(tool_use_id, render_patterns(ticker))
 
 
 # Function-style tools for backward compatibility and direct testing
@@ -155,26 +195,7 @@ def get_price_history_func(ticker: str) -> str:
         Formatted string with technical price analysis
 
     """
-    data = generate_mock_technical_data(ticker)
-
-    analysis = f"""
-    Technical Analysis for {ticker}:
-
-    Price Action:
-    - Current Price: ${data["current_price"]:.2f}
-    - 50-day SMA: ${data["sma_50"]:.2f}
-    - 200-day SMA: ${data["sma_200"]:.2f}
-    - Overall Trend: {data["trend"].title()}
-
-    Key Levels:
-    - Support: ${data["support_level"]:.2f}
-    - Resistance: ${data["resistance_level"]:.2f}
-
-    Volume Analysis:
-    - Volume Trend: {data["volume_trend"].title()}
-    """
-
-    return analysis
+    return render_price_history(ticker)
 
 
 @tool
@@ -192,35 +213,4 @@ def identify_patterns_func(ticker: str) -> str:
         Formatted string with pattern analysis and technical indicators
 
     """
-    data = generate_mock_technical_data(ticker)
-
-    # Constants for indicator thresholds
-    RSI_OVERBOUGHT = 70
-    RSI_OVERSOLD = 30
-
-    # Generate mock pattern analysis
-    patterns = [
-        "ascending triangle",
-        "head and shoulders",
-        "double bottom",
-        "bull flag",
-        "wedge",
-        "channel breakout",
-    ]
-    detected_pattern = random.choice(patterns)
-
-    analysis = f"""
-    Pattern Analysis for {ticker}:
-
-    Technical Indicators:
-    - RSI: {data["rsi"]:.1f} ({"Overbought" if data["rsi"] > RSI_OVERBOUGHT else "Oversold" if data["rsi"] < RSI_OVERSOLD else "Neutral"})
-    - MACD Signal: {data["macd_signal"].title()}
-    - Bollinger Bands: Price at {data["bollinger_position"]} band
-
-    Pattern Recognition:
-    - Detected Pattern: {detected_pattern.title()}
-    - Pattern Reliability: {random.choice(["High", "Medium", "Low"])}
-    - Suggested Action: {random.choice(["Buy", "Sell", "Hold", "Wait for breakout"])}
-    """
-
-    return analysis
+    return render_patterns(ticker)